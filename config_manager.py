@@ -11,6 +11,7 @@ from typing import Dict, Optional
 
 from PyQt6.QtWidgets import QApplication
 from ui.setup_wizard_dialog import SetupWizardDialog
+from ui.styles import APP_STYLESHEET
 
 class ConfigManager:
     """
@@ -76,6 +77,9 @@ class ConfigManager:
         if app is None:
             # Se não houver instância, cria uma temporária.
             app = QApplication(sys.argv)
+        # O assistente roda antes de main.py, que é quem aplica a folha de estilo da aplicação.
+        if not app.styleSheet():
+            app.setStyleSheet(APP_STYLESHEET)
 
         dialog = SetupWizardDialog()
         if dialog.exec():
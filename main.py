@@ -30,6 +30,7 @@ from models.usuario import Usuario, UserRole
 from services.usuario_service import UsuarioService
 from ui.login_dialog import LoginDialog
 from ui.main_window import MainWindow
+from ui.styles import APP_STYLESHEET
 
 class App:
     """
@@ -48,6 +49,11 @@ class App:
         self.db_manager = DatabaseManager()
         self.qt_app = QApplication(sys.argv)
         self.qt_app.setStyle('Fusion')
+        # Folha de estilo única da aplicação, interpretada uma só vez pelo Qt
+        self.qt_app.setStyleSheet(APP_STYLESHEET)
+        # Em modo --quiet (ex: testes automatizados), a janela principal fecha
+        # sem perguntar sobre o backup.
+        self.qt_app.setProperty("quiet_exit", "--quiet" in sys.argv)
         self.db_session = None
         self.usuario_service = None
 
@@ -6,7 +6,7 @@ Este módulo contém a classe `ClienteService`, que centraliza a lógica de
 negócio para manipulação de dados de clientes, servindo como uma ponte
 entre a interface do usuário e o acesso ao banco de dados.
 """
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from models.cliente import Cliente
@@ -105,6 +105,42 @@ class ClienteService:
             self.db.delete(cliente)
             self.db.commit()
 
+    def get_all_names_and_cpfs(self) -> List[Tuple[int, str, str]]:
+        """
+        Recupera apenas o ID, o nome e o CPF de todos os clientes.
+
+        Consulta somente as colunas necessárias, sem instanciar objetos Cliente,
+        para alimentar índices de busca em memória (ex: o completer de clientes).
+
+        Returns:
+            List[Tuple[int, str, str]]: Tuplas (id, nome, cpf), ordenadas por nome e ID.
+        """
+        rows = self.db.query(Cliente.id, Cliente.nome, Cliente.cpf).order_by(Cliente.nome, Cliente.id).all()
+        return [(cliente_id, nome, cpf) for cliente_id, nome, cpf in rows]
+
+    def search_clientes_for_completer(self, search_term: str, limit: Optional[int] = None) -> List[Tuple[int, str]]:
+        """
+        Busca clientes por nome ou CPF retornando o texto de exibição pronto.
+
+        O texto "Nome (CPF)" é montado pelo próprio banco de dados, de modo que
+        o resultado pode alimentar um QCompleter sem formatação adicional.
+
+        Args:
+            search_term (str): O termo para buscar (case-insensitive).
+            limit (Optional[int]): O número máximo de clientes a retornar.
+
+        Returns:
+            List[Tuple[int, str]]: Tuplas (id, "Nome (CPF)"), ordenadas por nome e ID.
+        """
+        display_text = Cliente.nome + " (" + Cliente.cpf + ")"
+        query = self.db.query(Cliente.id, display_text).order_by(Cliente.nome, Cliente.id)
+        if search_term:
+            search_pattern = f"%{search_term}%"
+            query = query.filter(or_(Cliente.nome.ilike(search_pattern), Cliente.cpf.ilike(search_pattern)))
+        if limit is not None:
+            query = query.limit(limit)
+        return [(cliente_id, display) for cliente_id, display in query.all()]
+
     def search_clientes(self, search_term: str, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Cliente]:
         """
         Busca clientes por nome ou CPF com suporte para paginação.
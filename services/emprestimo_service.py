@@ -9,7 +9,7 @@ de relatórios e indicadores para o dashboard.
 """
 from datetime import date, timedelta
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -30,6 +30,29 @@ class EmprestimoService:
     """
     def __init__(self, db_session: Session):
         self.db = db_session
+        # Versão dos dados de empréstimos/parcelas de cada cliente, incrementada
+        # a cada alteração feita por este serviço.
+        self._versions: Dict[int, int] = {}
+
+    def get_version(self, cliente_id: int) -> int:
+        """
+        Retorna a versão atual dos empréstimos e parcelas de um cliente.
+
+        A versão muda sempre que este serviço cria, altera ou exclui um
+        empréstimo ou parcela do cliente, permitindo que a interface evite
+        recarregar dados que não mudaram.
+
+        Args:
+            cliente_id (int): O ID do cliente.
+
+        Returns:
+            int: Um contador que só aumenta enquanto a aplicação está aberta.
+        """
+        return self._versions.get(cliente_id, 0)
+
+    def _bump_version(self, cliente_id: int):
+        """Marca os empréstimos e parcelas do cliente como alterados."""
+        self._versions[cliente_id] = self._versions.get(cliente_id, 0) + 1
 
     def get_taxas_config(self) -> Optional[TaxaJuros]:
         """
@@ -91,6 +114,7 @@ class EmprestimoService:
         self._calcular_e_criar_parcelas(novo_emprestimo)
 
         self.db.commit()
+        self._bump_version(novo_emprestimo.cliente_id)
 
    
     def get_proximos_vencimentos_detalhados(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -186,6 +210,35 @@ class EmprestimoService:
     def get_emprestimos_by_cliente_id(self, cliente_id: int) -> List[Emprestimo]:
         return self.db.query(Emprestimo).filter(Emprestimo.cliente_id == cliente_id).all()
 
+    def get_emprestimos_display_by_cliente_id(self, cliente_id: int) -> List[Tuple[str, str, str, str, int]]:
+        """
+        Busca os empréstimos de um cliente já formatados para exibição em tabela.
+
+        Consulta apenas as colunas necessárias (sem instanciar objetos ORM) e
+        formata os valores em uma única passagem.
+
+        Returns:
+            List[Tuple[str, str, str, str, int]]: Tuplas (ID, valor, juros, nº de parcelas, ID numérico).
+        """
+        rows = (
+            self.db.query(
+                Emprestimo.id,
+                Emprestimo.valor,
+                Emprestimo.taxa_juros_simples,
+                Emprestimo.taxa_juros_composto,
+                Emprestimo.taxa_juros_mora,
+                Emprestimo.numero_parcelas
+            )
+            .filter(Emprestimo.cliente_id == cliente_id)
+            .all()
+        )
+        return [
+            (str(emp_id), f"R$ {valor:,.2f}",
+             f"Simples: {simples}% | Composto: {composto}% | Mora: {mora}%",
+             str(numero_parcelas), emp_id)
+            for emp_id, valor, simples, composto, mora, numero_parcelas in rows
+        ]
+
     def get_parcelas_by_emprestimo_id(self, emprestimo_id: int) -> List[Parcela]:
         return self.db.query(Parcela).filter(Parcela.emprestimo_id == emprestimo_id).order_by(Parcela.numero).all()
 
@@ -201,6 +254,7 @@ class EmprestimoService:
             parcela.pago = True
             parcela.data_pagamento = date.today()
             self.db.commit()
+            self._bump_version(parcela.emprestimo.cliente_id)
             return parcela
         return None
 
@@ -209,13 +263,16 @@ class EmprestimoService:
         if parcela:
             parcela.valor = novo_valor
             self.db.commit()
+            self._bump_version(parcela.emprestimo.cliente_id)
 
     def delete_emprestimo(self, emprestimo_id: int):
         emprestimo = self.get_emprestimo_by_id(emprestimo_id)
         if emprestimo:
+            cliente_id = emprestimo.cliente_id
             self.db.query(Parcela).filter(Parcela.emprestimo_id == emprestimo_id).delete()
             self.db.delete(emprestimo)
             self.db.commit()
+            self._bump_version(cliente_id)
 
     def gerar_relatorio_html_emprestimo(self, emprestimo_id: int) -> str:
         """
@@ -285,4 +342,5 @@ class EmprestimoService:
 
         # Chama o método auxiliar para recalcular e criar as novas parcelas
         self._calcular_e_criar_parcelas(emprestimo)
-        self.db.commit()
\ No newline at end of file
+        self.db.commit()
+        self._bump_version(emprestimo.cliente_id)
\ No newline at end of file
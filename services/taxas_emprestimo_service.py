@@ -1,3 +1,5 @@
+from decimal import Decimal
+from typing import Tuple
 from models.taxas_emprestimo import TaxaJuros
 
 class TaxaJurosService:
@@ -12,6 +14,15 @@ class TaxaJurosService:
             self.db_session.commit()
         return taxas
 
+    def get_valores_taxas(self) -> Tuple[Decimal, Decimal, Decimal]:
+        """Retorna as taxas (simples, composto, mora) como valores simples, sem o objeto do ORM."""
+        taxas = self.get_taxas()
+        return (
+            taxas.taxa_juros_simples or Decimal("0"),
+            taxas.taxa_juros_composto or Decimal("0"),
+            taxas.taxa_juros_mora or Decimal("0"),
+        )
+
     def atualizar_taxas(self, simples, composto, mora):
         taxas = self.get_taxas()
         taxas.taxa_juros_simples = simples
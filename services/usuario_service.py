@@ -80,16 +80,43 @@ class UsuarioService:
         logging.warning(f"Tentativa de login inválida para o usuário: {email}")
         return None
 
-    def get_all_usuarios(self) -> List[Usuario]:
-        """Retorna uma lista de todos os usuários."""
-        return self.db_session.query(Usuario).all()
+    @db_session_manager(readonly=True)
+    def get_all_usuarios(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Usuario]:
+        """
+        Retorna uma lista de todos os usuários, com suporte a paginação.
 
-    def search_usuarios(self, search_term: str) -> List[Usuario]:
-        """Busca usuários por nome ou email."""
+        Args:
+            limit (Optional[int]): O número máximo de usuários a retornar.
+            offset (Optional[int]): O número de usuários a pular (para paginação).
+        """
+        return self._paginate(self.db_session.query(Usuario), limit, offset)
+
+    @db_session_manager(readonly=True)
+    def search_usuarios(self, search_term: str, limit: Optional[int] = None, offset: Optional[int] = None) -> List[Usuario]:
+        """
+        Busca usuários por nome ou email, com suporte a paginação.
+
+        Args:
+            search_term (str): O termo a ser buscado.
+            limit (Optional[int]): O número máximo de usuários a retornar.
+            offset (Optional[int]): O número de usuários a pular (para paginação).
+        """
         if not search_term:
-            return self.get_all_usuarios()
+            return self.get_all_usuarios(limit=limit, offset=offset)
 
         search_filter = f"%{search_term}%"
-        return self.db_session.query(Usuario).filter(
+        query = self.db_session.query(Usuario).filter(
             (Usuario.nome.ilike(search_filter)) | (Usuario.email.ilike(search_filter))
-        ).all()
\ No newline at end of file
+        )
+        return self._paginate(query, limit, offset)
+
+    @staticmethod
+    def _paginate(query, limit: Optional[int], offset: Optional[int]) -> List[Usuario]:
+        """Aplica LIMIT/OFFSET à consulta, com uma ordem estável entre as páginas."""
+        if limit is not None or offset is not None:
+            query = query.order_by(Usuario.id)
+        if offset is not None:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
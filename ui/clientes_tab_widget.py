@@ -22,6 +22,7 @@ from PyQt6.QtWidgets import (QApplication, QHeaderView, QHBoxLayout, QLabel, QMe
 from models.cliente import Cliente
 from services.cliente_service import ClienteService
 from .cliente_dialog import ClienteDialog
+from .deferred_refresh import DeferredRefreshMixin
 
 
 class ClienteLoaderWorker(QObject):
@@ -69,7 +70,7 @@ class ClienteLoaderWorker(QObject):
         except Exception as e:
             self.error.emit(f"Não foi possível carregar os clientes: {e}")
 
-class ClientesTabWidget(QWidget):
+class ClientesTabWidget(DeferredRefreshMixin, QWidget):
     """
     Um widget de aba para gerenciar clientes (CRUD e busca).
     Encapsula toda a lógica e UI da aba de clientes.
@@ -217,15 +218,20 @@ class ClientesTabWidget(QWidget):
         """Adiciona uma lista de clientes ao final da tabela."""
         start_row = self.table.rowCount()
         self.table.setRowCount(start_row + len(clientes))
-        for row_offset, cliente in enumerate(clientes):
-            row = start_row + row_offset
-            self.table.setItem(row, self._ClienteTableCols.ID, QTableWidgetItem(str(cliente.id)))
-            self.table.setItem(row, self._ClienteTableCols.NOME, QTableWidgetItem(cliente.nome))
-            self.table.setItem(row, self._ClienteTableCols.CPF, QTableWidgetItem(cliente.cpf))
-            self.table.setItem(row, self._ClienteTableCols.TELEFONE, QTableWidgetItem(cliente.telefone))
-            self.table.setItem(row, self._ClienteTableCols.EMAIL, QTableWidgetItem(cliente.email))
-            self.table.setItem(row, self._ClienteTableCols.ENDERECO, QTableWidgetItem(cliente.endereco))
-            self.table.setItem(row, self._ClienteTableCols.OUTRAS_INFORMACOES, QTableWidgetItem(cliente.outras_informacoes or ""))
+        # Atributos e classes usados no laço são vinculados a variáveis locais uma única vez
+        set_item = self.table.setItem
+        item = QTableWidgetItem
+        cols = self._ClienteTableCols
+        ID, NOME, CPF, TELEFONE = cols.ID, cols.NOME, cols.CPF, cols.TELEFONE
+        EMAIL, ENDERECO, OUTRAS = cols.EMAIL, cols.ENDERECO, cols.OUTRAS_INFORMACOES
+        for row, cliente in enumerate(clientes, start_row):
+            set_item(row, ID, item(str(cliente.id)))
+            set_item(row, NOME, item(cliente.nome))
+            set_item(row, CPF, item(cliente.cpf))
+            set_item(row, TELEFONE, item(cliente.telefone))
+            set_item(row, EMAIL, item(cliente.email))
+            set_item(row, ENDERECO, item(cliente.endereco))
+            set_item(row, OUTRAS, item(cliente.outras_informacoes or ""))
 
     def _trigger_data_load(self):
         """
@@ -397,10 +403,23 @@ class ClientesTabWidget(QWidget):
         Garante que o thread de carregamento seja finalizado antes que o widget seja destruído.
         Este método é chamado pelo 'closeEvent' da janela principal para um encerramento seguro.
         """
+        self.request_stop_threads()
+        self.join_threads()
+
+    def request_stop_threads(self):
+        """Solicita o encerramento do thread de carregamento, sem esperar por ele."""
         if self.loading_thread and self.loading_thread.isRunning():
             self.loading_thread.quit()
-            # Espera até 2 segundos para o thread terminar de forma limpa.
-            self.loading_thread.wait(2000)
+
+    def join_threads(self, timeout_ms: int = 2000):
+        """
+        Espera o thread de carregamento terminar de forma limpa.
+
+        Args:
+            timeout_ms (int): Tempo máximo de espera, em milissegundos.
+        """
+        if self.loading_thread and self.loading_thread.isRunning():
+            self.loading_thread.wait(timeout_ms)
 
     def refresh_data(self):
         """Método público para recarregar os dados da aba, limpando a busca."""
@@ -19,11 +19,11 @@ from PyQt6.QtWidgets import (QFrame, QGraphicsDropShadowEffect, QHBoxLayout,
 from models.usuario import Usuario
 from services.cliente_service import ClienteService
 from services.emprestimo_service import EmprestimoService
-from . import styles
+from .deferred_refresh import DeferredRefreshMixin
 from .relogio_widget import RelogioWidget
 
 
-class DashboardStatic(QWidget):
+class DashboardStatic(DeferredRefreshMixin, QWidget):
     """
     Um widget reutilizável que exibe um dashboard estático.
 
@@ -34,6 +34,9 @@ class DashboardStatic(QWidget):
     - Encapsular a lógica de busca e atualização dos dados do dashboard,
       oferecendo uma API clara através do método `refresh()`.
     """
+    # Método de atualização chamado pelo DeferredRefreshMixin
+    _refresh_method = "refresh"
+
     # Constantes para as colunas da tabela, mantendo o padrão do projeto.
     class _VencimentosTableCols:
         CLIENTE, EMPRESTIMO_ID, PARCELA, VENCIMENTO = range(4)
@@ -159,7 +162,7 @@ class DashboardStatic(QWidget):
         button = QPushButton(f" {text}")
         button.setIcon(icon)
         button.setIconSize(QSize(24, 24))
-        button.setStyleSheet(styles.SHORTCUT_BUTTON_STYLE)
+        button.setProperty("buttonType", "atalho")  # Estilo em styles.SHORTCUT_BUTTON_STYLE
         button.setMinimumHeight(50)
         button.clicked.connect(on_click)
         return button
@@ -177,15 +180,14 @@ class DashboardStatic(QWidget):
         """
         card = QFrame()
         card.setObjectName("indicatorCard")
-        card.setStyleSheet(styles.INDICATOR_CARD_STYLE)
         layout = QVBoxLayout(card)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
         title_label = QLabel(title)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(styles.INDICATOR_TITLE_STYLE)
+        title_label.setObjectName("indicatorTitle")
         value_label = QLabel("0")
         value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        value_label.setStyleSheet(styles.INDICATOR_VALUE_STYLE)
+        value_label.setObjectName("indicatorValue")
         layout.addWidget(title_label)
         layout.addWidget(value_label)
         shadow = QGraphicsDropShadowEffect(blurRadius=15, xOffset=0, yOffset=2, color=QColor(0, 0, 0, 60))
@@ -223,4 +225,4 @@ class DashboardStatic(QWidget):
         Funciona como um alias para `update_data`, fornecendo uma API pública
         clara e consistente com os outros widgets de aba.
         """
-        self.update_data()
\ No newline at end of file
+        self.update_data()
@@ -0,0 +1,70 @@
+# ui/deferred_refresh.py
+"""
+Módulo que define o DeferredRefreshMixin.
+
+Permite que widgets de aba adiem a atualização dos seus dados enquanto não
+estão visíveis: em vez de recarregar imediatamente, a aba é marcada como
+"suja" e a atualização acontece uma única vez, quando ela volta a ser exibida.
+"""
+
+
+class DeferredRefreshMixin:
+    """
+    Mixin para widgets de aba que recarregam seus dados sob demanda.
+
+    Deve aparecer antes da classe base do Qt na herança, por exemplo:
+    `class MinhaAba(DeferredRefreshMixin, QWidget)`.
+
+    A classe que usa o mixin deve implementar o método de atualização cujo nome
+    está em `_refresh_method` (por padrão, `refresh_data()`, sem argumentos), ou
+    sobrescrever `_refresh_method` com o nome do seu próprio método.
+    """
+    # Nome do método, sem argumentos, que recarrega os dados do widget
+    _refresh_method = "refresh_data"
+    _needs_refresh = False
+    # Indica que o último showEvent já executou a atualização pendente
+    _refreshed_on_show = False
+
+    def mark_dirty(self):
+        """
+        Sinaliza que os dados exibidos estão desatualizados.
+
+        Se o widget estiver visível, atualiza imediatamente; caso contrário, a
+        atualização é adiada até o próximo `showEvent`.
+        """
+        if self.isVisible():
+            self._needs_refresh = False
+            self._run_refresh()
+        else:
+            self._needs_refresh = True
+
+    def showEvent(self, event):
+        """Executa a atualização pendente quando o widget volta a ser exibido."""
+        super().showEvent(event)
+        # Eventos espontâneos (ex: restaurar a janela minimizada) não indicam troca de aba.
+        if self._needs_refresh and not event.spontaneous():
+            self._needs_refresh = False
+            self._refreshed_on_show = True
+            self._run_refresh()
+
+    def hideEvent(self, event):
+        """Ao ocultar o widget, a atualização feita na última exibição deixa de contar."""
+        super().hideEvent(event)
+        if not event.spontaneous():
+            self._refreshed_on_show = False
+
+    def refresh_on_tab_change(self):
+        """
+        Atualiza o widget após ele ser selecionado como aba.
+
+        Se o `showEvent` já executou uma atualização pendente ao exibi-lo, não
+        faz nada, evitando recarregar os dados duas vezes na mesma troca de aba.
+        """
+        if self._refreshed_on_show:
+            self._refreshed_on_show = False
+            return
+        self.mark_dirty()
+
+    def _run_refresh(self):
+        """Chama o método de atualização do widget (ver `_refresh_method`)."""
+        getattr(self, self._refresh_method)()
@@ -53,7 +53,8 @@ class EditEmprestimoDialog(QDialog):
         form_layout.addRow("Número de Parcelas:", self.num_parcelas_input)
 
         self.data_inicio_input = QDateEdit(self)
-        self.data_inicio_input.setDate(QDate(self.emprestimo.data_inicio))
+        data_inicio = self.emprestimo.data_inicio
+        self.data_inicio_input.setDate(QDate(data_inicio.year, data_inicio.month, data_inicio.day))
         self.data_inicio_input.setCalendarPopup(True)
         self.data_inicio_input.setDisplayFormat("dd/MM/yyyy")
         form_layout.addRow(QLabel("Data de Início:"), self.data_inicio_input)
@@ -1,7 +1,7 @@
 # ui/emprestimo_dialog.py
 
 from decimal import Decimal
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from PyQt6.QtCore import QDate, Qt, QStringListModel
 from PyQt6.QtWidgets import (QDialog, QDialogButtonBox, QDoubleSpinBox,
@@ -12,7 +12,6 @@ from PyQt6.QtWidgets import (QDialog, QDialogButtonBox, QDoubleSpinBox,
 from services.cliente_service import ClienteService
 from services.emprestimo_service import EmprestimoService
 from ui.cliente_dialog import ClienteDialog
-from ui import styles
 from models.emprestimo import TipoJuros
 
 
@@ -40,6 +39,7 @@ class EmprestimoDialog(QDialog):
         self.taxas = None
         self.selected_cliente_id: Optional[int] = None
         self.completer_cliente_map: Dict[str, int] = {}
+        self._completer_keys: Tuple[str, ...] = ()
 
         try:
             self.taxas = self.emprestimo_service.get_taxas_config()
@@ -63,8 +63,9 @@ class EmprestimoDialog(QDialog):
         # Configuração do QCompleter para a busca
         self.completer = QCompleter(self)
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        self.completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        self.completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
+        # As sugestões já chegam filtradas (nome ou CPF contendo o termo); o
+        # completer apenas as exibe, sem refiltrar o modelo a cada tecla.
+        self.completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
         
         self.cliente_completer_model = QStringListModel(self)
         self.completer.setModel(self.cliente_completer_model)
@@ -72,7 +73,7 @@ class EmprestimoDialog(QDialog):
         self.completer.activated.connect(self._set_selected_cliente)
 
         btn_novo_cliente = QPushButton("Novo Cliente")
-        btn_novo_cliente.setStyleSheet(styles.get_button_style('novo'))
+        btn_novo_cliente.setProperty("buttonType", "novo")
         btn_novo_cliente.clicked.connect(self.criar_novo_cliente)
         
         cliente_row_layout = QHBoxLayout()
@@ -115,7 +116,7 @@ class EmprestimoDialog(QDialog):
 
         # Prévia do Valor da Parcela
         self.parcela_preview_label = QLabel("R$ 0,00")
-        self.parcela_preview_label.setStyleSheet("font-weight: bold; font-size: 11pt; color: #2980b9;")
+        self.parcela_preview_label.setObjectName("parcelaPreview")  # Estilo em styles.DIALOG_LABEL_STYLE
         form_layout.addRow("Valor Estimado da Parcela:", self.parcela_preview_label)
 
         layout.addLayout(form_layout)
@@ -152,7 +153,11 @@ class EmprestimoDialog(QDialog):
                 display_text = f"{cliente.nome} ({cliente.cpf})"
                 self.selected_cliente_id = cliente.id
                 self.completer_cliente_map[display_text] = cliente.id
+
+                # Bloqueia os sinais para não disparar uma nova busca pelo cliente já selecionado
+                self.cliente_search_input.blockSignals(True)
                 self.cliente_search_input.setText(display_text)
+                self.cliente_search_input.blockSignals(False)
         except Exception as e:
             print(f"Erro ao pré-selecionar cliente: {e}")
 
@@ -172,7 +177,7 @@ class EmprestimoDialog(QDialog):
             self.selected_cliente_id = None
 
         if len(text) < 2:
-            self.cliente_completer_model.setStringList([])
+            self._set_completer_keys(())
             self.completer_cliente_map.clear()
             return
 
@@ -181,14 +186,29 @@ class EmprestimoDialog(QDialog):
             return
 
         try:
-            clientes = self.cliente_service.search_clientes(text, limit=10)
-            new_map = {f"{c.nome} ({c.cpf})": c.id for c in clientes}
+            clientes = self.cliente_service.search_clientes_for_completer(text, limit=10)
+            new_map = {display: cliente_id for cliente_id, display in clientes}
             self.completer_cliente_map = new_map
-            self.cliente_completer_model.setStringList(list(new_map.keys()))
+            self._set_completer_keys(tuple(new_map))
         except Exception as e:
             print(f"Erro ao buscar clientes: {e}")
-            self.cliente_completer_model.setStringList([])
+            self._set_completer_keys(())
             self.completer_cliente_map.clear()
+
+    def _set_completer_keys(self, keys: Tuple[str, ...]) -> None:
+        """
+        Atualiza o modelo do QCompleter apenas se a lista de sugestões mudou.
+
+        Evita resets desnecessários do modelo (e a consequente reindexação do
+        completer) quando a busca retorna os mesmos clientes da anterior.
+
+        Args:
+            keys (Tuple[str, ...]): Os textos de exibição das sugestões, em ordem.
+        """
+        if keys == self._completer_keys:
+            return
+        self._completer_keys = keys
+        self.cliente_completer_model.setStringList(list(keys))
     
     def _set_selected_cliente(self, completion_text: str) -> None:
         """
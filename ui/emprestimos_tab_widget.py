@@ -6,29 +6,268 @@ Este widget encapsula toda a funcionalidade da aba de gerenciamento de emprésti
 incluindo a busca de clientes, listagem de empréstimos e parcelas, e todas as
 operações de CRUD relacionadas.
 """
-from decimal import Decimal
-from typing import Optional
+import functools
+import itertools
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+from PyQt6.QtCore import (QAbstractTableModel, QEvent, QModelIndex, QRect,
+                          QSize, Qt, QStringListModel, QThreadPool, QTimer,
+                          pyqtSignal)
+from PyQt6.QtGui import QPixmap
+from PyQt6.QtWidgets import (QAbstractItemView, QCompleter, QHeaderView,
+                             QHBoxLayout, QLabel, QMenu, QMessageBox,
+                             QPushButton, QStyledItemDelegate,
+                             QStyleOptionViewItem, QTableView, QLineEdit,
+                             QVBoxLayout, QWidget)
 
-from PyQt6.QtCore import Qt, QStringListModel
-from PyQt6.QtWidgets import (QCompleter, QHeaderView, QHBoxLayout, QLabel,
-                             QMenu, QMessageBox, QPushButton, QTableWidget,
-                             QTableWidgetItem, QLineEdit, QVBoxLayout, QWidget)
-
-from models.emprestimo import Emprestimo
 from models.parcela import Parcela
 from models.usuario import UserRole, Usuario
 from services.cliente_service import ClienteService
 from services.emprestimo_service import EmprestimoService
 from services.usuario_service import UsuarioService
-from . import styles
 from .authorization_dialog import AuthorizationDialog
+from .deferred_refresh import DeferredRefreshMixin
 from .edit_emprestimo_dialog import EditEmprestimoDialog
 from .edit_parcela_dialog import EditParcelaDialog
 from .emprestimo_dialog import EmprestimoDialog
 from .relatorio_parcelas_dialog import RelatorioParcelasDialog
+from .workers import Worker
+
+
+# Papel do modelo que indica se os botões de ação da linha estão habilitados
+ACTIONS_ENABLED_ROLE = Qt.ItemDataRole.UserRole
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """
+    Delegate que desenha os botões de ação de uma linha sem criar widgets.
+
+    Cada botão é renderizado uma única vez como imagem (com o estilo QSS já
+    aplicado) e apenas copiado para a célula em `paint()`. Os cliques são
+    tratados em `editorEvent` e emitidos pelo sinal `actionClicked`.
+    """
+    actionClicked = pyqtSignal(int, str)  # (linha, id da ação)
+
+    _MARGIN = 5
+    _SPACING = 5
+
+    # Imagens já renderizadas, compartilhadas entre todas as instâncias:
+    # (rótulo, tipo de estilo, habilitado) -> (imagem, tamanho)
+    _pixmap_cache: Dict[Tuple[str, str, bool], Tuple[QPixmap, QSize]] = {}
+    # Botão protótipo reaproveitado em todas as renderizações
+    _prototype: Optional[QPushButton] = None
+
+    def __init__(self, actions: List[Tuple[str, str, str]], parent: Optional[QWidget] = None):
+        """
+        Args:
+            actions (List[Tuple[str, str, str]]): Lista de (id da ação, rótulo, tipo de estilo do botão).
+            parent (Optional[QWidget]): O objeto pai.
+        """
+        super().__init__(parent)
+        self._action_ids = [action_id for action_id, _, _ in actions]
+        # (id da ação, habilitado) -> imagem do botão
+        self._pixmaps = {
+            (action_id, enabled): self._render_button(label, style_key, enabled)
+            for action_id, label, style_key in actions
+            for enabled in (True, False)
+        }
+        self._sizes = [self._pixmaps[(action_id, True)][1] for action_id in self._action_ids]
+
+    @classmethod
+    def _render_button(cls, label: str, style_key: str, enabled: bool) -> Tuple[QPixmap, QSize]:
+        """
+        Renderiza um botão estilizado fora da tela e retorna sua imagem e tamanho.
+        Cada combinação é renderizada apenas uma vez por execução.
+        """
+        key = (label, style_key, enabled)
+        cached = cls._pixmap_cache.get(key)
+        if cached is None:
+            if cls._prototype is None:
+                cls._prototype = QPushButton()
+            button = cls._prototype
+            button.setText(label)
+            button.setProperty("buttonType", style_key)
+            button.setEnabled(enabled)
+            # Reaplica a folha de estilo da aplicação para o novo tipo de botão
+            button.style().unpolish(button)
+            button.style().polish(button)
+            button.resize(button.sizeHint())
+            cached = cls._pixmap_cache[key] = (button.grab(), button.size())
+        return cached
+
+    def _button_rects(self, cell: QRect) -> List[QRect]:
+        """Calcula a posição de cada botão dentro da célula."""
+        rects = []
+        x = cell.left() + self._MARGIN
+        for size in self._sizes:
+            y = cell.top() + (cell.height() - size.height()) // 2
+            rects.append(QRect(x, y, size.width(), size.height()))
+            x += size.width() + self._SPACING
+        return rects
+
+    def paint(self, painter, option: QStyleOptionViewItem, index: QModelIndex):
+        super().paint(painter, option, index)
+        enabled = index.data(ACTIONS_ENABLED_ROLE) is not False
+        painter.save()
+        painter.setClipRect(option.rect)
+        for action_id, rect in zip(self._action_ids, self._button_rects(option.rect)):
+            painter.drawPixmap(rect, self._pixmaps[(action_id, enabled)][0])
+        painter.restore()
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        width = sum(size.width() for size in self._sizes)
+        width += 2 * self._MARGIN + self._SPACING * (len(self._sizes) - 1)
+        height = max((size.height() for size in self._sizes), default=0)
+        return QSize(width, height)
+
+    def editorEvent(self, event, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and index.data(ACTIONS_ENABLED_ROLE) is not False):
+            pos = event.position().toPoint()
+            for action_id, rect in zip(self._action_ids, self._button_rects(option.rect)):
+                if rect.contains(pos):
+                    self.actionClicked.emit(index.row(), action_id)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+
+class _ListTableModel(QAbstractTableModel):
+    """
+    Modelo de tabela somente leitura sobre uma lista de objetos.
+
+    Mantém apenas as referências aos objetos carregados; o texto de cada célula
+    é formatado sob demanda em `data()`, somente para as células que a view
+    efetivamente exibe. As linhas são expostas à view em lotes de `BATCH_SIZE`
+    (`canFetchMore`/`fetchMore`), conforme a rolagem se aproxima do fim.
+    """
+    BATCH_SIZE = 100
+
+    def __init__(self, cols, parent: Optional[QWidget] = None):
+        """
+        Args:
+            cols: A classe de constantes de colunas da tabela (índices e HEADERS).
+            parent (Optional[QWidget]): O objeto pai.
+        """
+        super().__init__(parent)
+        self._cols = cols
+        self._rows: List[Any] = []
+        self._loaded = 0  # Quantidade de linhas já expostas à view
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cols.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._cols.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display(self._rows[index.row()], index.column())
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self._alignment(index.column())
+        if role == ACTIONS_ENABLED_ROLE:
+            return self._actions_enabled(self._rows[index.row()])
+        return None
+
+    def _display(self, obj: Any, column: int) -> Optional[str]:
+        """Retorna o texto exibido para o objeto na coluna informada, ou None para célula vazia."""
+        return None
+
+    def _alignment(self, column: int):
+        """Retorna o alinhamento da coluna, ou None para o padrão."""
+        return None
+
+    def _actions_enabled(self, obj: Any) -> bool:
+        """Indica se os botões de ação da linha estão habilitados."""
+        return True
+
+    def set_rows(self, rows: List[Any]):
+        """Substitui todas as linhas do modelo com um único reset."""
+        self.beginResetModel()
+        self._rows = rows
+        self._loaded = min(self.BATCH_SIZE, len(rows))
+        self.endResetModel()
+
+    def clear(self):
+        """Remove todas as linhas do modelo."""
+        self.set_rows([])
+
+    def row_at(self, row: int) -> Any:
+        """Retorna o objeto exibido na linha informada."""
+        return self._rows[row]
+
+    def update_row(self, row: int, obj: Any):
+        """Substitui o objeto de uma única linha e notifica a view apenas sobre ela."""
+        self._rows[row] = obj
+        if row < self._loaded:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+
+class EmprestimoTableModel(_ListTableModel):
+    """
+    Modelo da tabela de empréstimos de um cliente.
+
+    As linhas são as tuplas pré-formatadas de
+    `EmprestimoService.get_emprestimos_display_by_cliente_id`; as colunas de
+    texto são lidas diretamente da tupla e o último item é o ID numérico.
+    """
+    def _display(self, row: Tuple[str, str, str, str, int], column: int) -> Optional[str]:
+        return row[column] if column < self._cols.ACOES else None
 
 
-class EmprestimosTabWidget(QWidget):
+class ParcelaTableModel(_ListTableModel):
+    """Modelo da tabela de parcelas de um empréstimo."""
+    # Valores fixos da coluna "Pago", compartilhados por todas as linhas
+    _PAGO_TEXT = ("Não", "Sim")
+    _PAGO_ALIGNMENT = Qt.AlignmentFlag.AlignCenter
+
+    def _display(self, parcela: Parcela, column: int) -> Optional[str]:
+        cols = self._cols
+        if column == cols.NUMERO:
+            return str(parcela.numero)
+        if column == cols.VALOR:
+            return f"R$ {parcela.valor:,.2f}"
+        if column == cols.VENCIMENTO:
+            return parcela.data_vencimento.strftime('%d/%m/%Y')
+        if column == cols.PAGO:
+            return self._PAGO_TEXT[bool(parcela.pago)]
+        return None
+
+    def _alignment(self, column: int):
+        return self._PAGO_ALIGNMENT if column == self._cols.PAGO else None
+
+    def _actions_enabled(self, parcela: Parcela) -> bool:
+        return not parcela.pago
+
+    def find_row(self, parcela_id: int) -> Optional[int]:
+        """Retorna a linha da parcela com o ID informado, ou None se não estiver no modelo."""
+        return next((row for row, parcela in enumerate(self._rows) if parcela.id == parcela_id), None)
+
+
+class EmprestimosTabWidget(DeferredRefreshMixin, QWidget):
     """
     Um widget de aba para gerenciar empréstimos e parcelas.
     """
@@ -41,6 +280,13 @@ class EmprestimosTabWidget(QWidget):
         NUMERO, VALOR, VENCIMENTO, PAGO, ACOES = range(5)
         HEADERS = ["Nº", "Valor", "Vencimento", "Pago", "Ações"]
 
+    # Número máximo de sugestões exibidas no completer de clientes
+    _COMPLETER_LIMIT = 10
+    # Validade (em segundos) de uma autorização concedida para ações em parcelas
+    _AUTH_TTL = 300
+    # Número máximo de clientes com empréstimos mantidos em cache
+    _EMPRESTIMOS_CACHE_SIZE = 50
+
     def __init__(self, usuario_logado: Usuario, emprestimo_service: EmprestimoService,
                  cliente_service: ClienteService, usuario_service: UsuarioService, parent: Optional[QWidget] = None):
         super().__init__(parent)
@@ -53,9 +299,34 @@ class EmprestimosTabWidget(QWidget):
         self.selected_cliente_id = None
         self.completer_cliente_map = {}
         self.current_emprestimo_id_for_parcelas = None
-
+        self._pending_cliente_search_text = ""
+        # Sugestões atualmente no modelo do completer, para evitar resets redundantes
+        self._current_completer_keys: Tuple[str, ...] = ()
+        # Índice local de clientes para o completer: (id, "Nome (CPF)", chave normalizada).
+        # Carregado em segundo plano na primeira busca e descartado em refresh_data.
+        self._clientes_index: Optional[List[Tuple[int, str, str]]] = None
+        self._index_loading = False
+        # Geração do índice atual; cargas iniciadas antes de uma invalidação são descartadas
+        self._search_gen = 0
+        # Empréstimos já carregados por cliente (LRU): cliente_id -> (versão, linhas formatadas).
+        # Invalidado pela versão do EmprestimoService; alterações feitas fora do serviço
+        # (ex: restauração de backup) devem chamar invalidate_cache().
+        self._emprestimos_cache: "OrderedDict[int, Tuple[int, List[Tuple[str, str, str, str, int]]]]" = OrderedDict()
+        # (emprestimo_id, versão) das parcelas exibidas na tabela, ou None se vazia
+        self._parcelas_loaded_key: Optional[Tuple[int, int]] = None
+        # Autorizações concedidas: perfis permitidos -> instante de expiração (time.monotonic)
+        self._auth_cache: Dict[frozenset, float] = {}
+
+        self._setup_cliente_search_timer()
         self._setup_ui()
 
+    def _setup_cliente_search_timer(self):
+        """Configura o timer para debouncing da busca de clientes do completer."""
+        self.cliente_search_timer = QTimer(self)
+        self.cliente_search_timer.setSingleShot(True)
+        self.cliente_search_timer.setInterval(180)  # Atraso de 180ms
+        self.cliente_search_timer.timeout.connect(self._update_cliente_completer)
+
     def _setup_ui(self):
         """Configura a interface da aba de empréstimos."""
         layout = QVBoxLayout(self)
@@ -65,24 +336,25 @@ class EmprestimosTabWidget(QWidget):
         search_label = QLabel("Buscar Cliente (Nome/CPF):")
         self.cliente_search_input = QLineEdit()
         self.cliente_search_input.setPlaceholderText("Digite 2+ caracteres para buscar...")
-        self.cliente_search_input.textChanged.connect(self._update_cliente_completer)
+        self.cliente_search_input.textChanged.connect(self._schedule_cliente_search)
 
-        completer = QCompleter(self)
-        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
-        completer.setFilterMode(Qt.MatchFlag.MatchContains)
-        completer.setCompletionMode(QCompleter.CompletionMode.PopupCompletion)
-        self.cliente_search_input.setCompleter(completer)
+        self.cliente_completer = QCompleter(self)
+        self.cliente_completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        # As sugestões já chegam filtradas (nome ou CPF contendo o termo); o
+        # completer apenas as exibe, sem refiltrar o modelo a cada tecla.
+        self.cliente_completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.cliente_search_input.setCompleter(self.cliente_completer)
 
         self.cliente_completer_model = QStringListModel(self)
-        completer.setModel(self.cliente_completer_model)
-        completer.activated.connect(self._on_cliente_selected_from_completer)
+        self.cliente_completer.setModel(self.cliente_completer_model)
+        self.cliente_completer.activated.connect(self._on_cliente_selected_from_completer)
 
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.cliente_search_input)
         layout.addLayout(search_layout)
 
         self.selected_cliente_label = QLabel("Nenhum cliente selecionado.")
-        self.selected_cliente_label.setStyleSheet("font-style: italic; color: #555; padding: 5px 0;")
+        self.selected_cliente_label.setObjectName("selectedCliente")  # Estilo em styles.DIALOG_LABEL_STYLE
         layout.addWidget(self.selected_cliente_label)
 
         btn_layout = QHBoxLayout()
@@ -91,11 +363,11 @@ class EmprestimosTabWidget(QWidget):
         btn_layout.addWidget(self.btn_novo_emprestimo)
         layout.addLayout(btn_layout)
 
-        self.emprestimos_table = QTableWidget()
-        self.emprestimos_table.setColumnCount(len(self._EmprestimoTableCols.HEADERS))
-        self.emprestimos_table.setHorizontalHeaderLabels(self._EmprestimoTableCols.HEADERS)
-        self.emprestimos_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.emprestimos_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.emprestimos_table = QTableView()
+        self._emprestimo_model = EmprestimoTableModel(self._EmprestimoTableCols, self)
+        self.emprestimos_table.setModel(self._emprestimo_model)
+        self.emprestimos_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.emprestimos_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         header = self.emprestimos_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         header.setSectionResizeMode(self._EmprestimoTableCols.ID, QHeaderView.ResizeMode.ResizeToContents)
@@ -105,13 +377,23 @@ class EmprestimosTabWidget(QWidget):
         self.emprestimos_table.setColumnWidth(self._EmprestimoTableCols.VALOR, 120)
         self.emprestimos_table.setColumnWidth(self._EmprestimoTableCols.JUROS, 220)
         self.emprestimos_table.setColumnWidth(self._EmprestimoTableCols.ACOES, 360)
+        self._emprestimo_actions = ActionsDelegate([
+            ("parcelas", "Parcelas", "imprimir"),
+            ("imprimir", "Imprimir", "imprimir"),
+            ("editar", "Editar", "editar"),
+            ("excluir", "Excluir", "excluir"),
+        ], self.emprestimos_table)
+        self._emprestimo_actions.actionClicked.connect(self._on_emprestimo_action)
+        self.emprestimos_table.setItemDelegateForColumn(self._EmprestimoTableCols.ACOES, self._emprestimo_actions)
+        self.emprestimos_table.verticalHeader().setDefaultSectionSize(
+            self._emprestimo_actions.sizeHint(QStyleOptionViewItem(), QModelIndex()).height())
         layout.addWidget(self.emprestimos_table)
 
-        self.parcelas_table = QTableWidget()
-        self.parcelas_table.setColumnCount(len(self._ParcelaTableCols.HEADERS))
-        self.parcelas_table.setHorizontalHeaderLabels(self._ParcelaTableCols.HEADERS)
-        self.parcelas_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.parcelas_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.parcelas_table = QTableView()
+        self._parcela_model = ParcelaTableModel(self._ParcelaTableCols, self)
+        self.parcelas_table.setModel(self._parcela_model)
+        self.parcelas_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.parcelas_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         parcelas_header = self.parcelas_table.horizontalHeader()
         parcelas_header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         parcelas_header.setSectionResizeMode(self._ParcelaTableCols.NUMERO, QHeaderView.ResizeMode.ResizeToContents)
@@ -119,23 +401,109 @@ class EmprestimosTabWidget(QWidget):
         self.parcelas_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.parcelas_table.customContextMenuRequested.connect(self._show_parcela_context_menu)
         self.parcelas_table.setColumnWidth(self._ParcelaTableCols.ACOES, 220)
+        self._parcela_actions = ActionsDelegate([
+            ("editar", "Editar", "editar"),
+            ("pagar", "Registrar Pagamento", "pagar"),
+        ], self.parcelas_table)
+        self._parcela_actions.actionClicked.connect(self._on_parcela_action)
+        self.parcelas_table.setItemDelegateForColumn(self._ParcelaTableCols.ACOES, self._parcela_actions)
+        self.parcelas_table.verticalHeader().setDefaultSectionSize(
+            self._parcela_actions.sizeHint(QStyleOptionViewItem(), QModelIndex()).height())
         layout.addWidget(self.parcelas_table)
 
-    def _update_cliente_completer(self, text: str):
-        if text in self.completer_cliente_map: return
-        if len(text) < 2:
-            self.cliente_completer_model.setStringList([])
-            self.completer_cliente_map.clear()
+    def _schedule_cliente_search(self, text: str):
+        """
+        Agenda a busca do completer, reiniciando o timer a cada tecla digitada.
+        Apenas a última alteração de uma sequência rápida dispara a consulta.
+        """
+        self._pending_cliente_search_text = text
+        if text in self.completer_cliente_map:
+            # O texto veio de uma seleção do completer; não há o que buscar.
+            self.cliente_search_timer.stop()
             return
+        self.cliente_search_timer.start()
+
+    def _load_clientes_index(self) -> List[Tuple[int, str, str]]:
+        """
+        Carrega (id, nome, cpf) de todos os clientes e monta o índice de busca.
+
+        Cada entrada guarda o texto de exibição "Nome (CPF)" já formatado e uma
+        chave normalizada (nome e CPF em minúsculas), permitindo responder às
+        buscas do completer localmente, sem consultar o banco nem formatar
+        strings a cada tecla. Executado em segundo plano.
+
+        A sessão da interface não pode ser compartilhada entre threads, então a
+        consulta usa uma sessão própria e de curta duração, ligada ao mesmo banco.
+        """
+        session = Session(bind=self.cliente_service.db.get_bind())
         try:
-            clientes = self.cliente_service.search_clientes(text, limit=10)
-            new_map = {f"{c.nome} ({c.cpf})": c.id for c in clientes}
-            self.completer_cliente_map = new_map
-            self.cliente_completer_model.setStringList(list(new_map.keys()))
-        except Exception as e:
-            print(f"Erro ao buscar clientes para o completer: {e}")
-            self.cliente_completer_model.setStringList([])
+            clientes = ClienteService(session).get_all_names_and_cpfs()
+        finally:
+            session.close()
+        return [
+            (cliente_id, f"{nome} ({cpf})", f"{nome}\n{cpf}".lower())
+            for cliente_id, nome, cpf in clientes
+        ]
+
+    def _invalidate_clientes_index(self):
+        """Descarta o índice de clientes; ele será recarregado na próxima busca."""
+        self._clientes_index = None
+        self._index_loading = False
+        self._search_gen += 1  # Um carregamento em andamento passa a ser obsoleto
+
+    def _update_cliente_completer(self):
+        text = self._pending_cliente_search_text
+        if text in self.completer_cliente_map: return
+        search_key = text.strip().lower()
+        if len(search_key) < 2:
+            self._set_completer_keys(())
             self.completer_cliente_map.clear()
+            return
+        if self._clientes_index is None:
+            # Primeira busca da sessão: carrega o índice no QThreadPool e
+            # responde à busca pendente quando ele estiver pronto.
+            if not self._index_loading:
+                self._index_loading = True
+                worker = Worker(self._load_clientes_index)
+                worker.signals.finished.connect(functools.partial(self._on_clientes_index_loaded, self._search_gen))
+                worker.signals.error.connect(functools.partial(self._on_clientes_index_error, self._search_gen))
+                QThreadPool.globalInstance().start(worker)
+            return
+        matches = (c for c in self._clientes_index if search_key in c[2])
+        new_map = {display: cliente_id
+                   for cliente_id, display, _ in itertools.islice(matches, self._COMPLETER_LIMIT)}
+        self.completer_cliente_map = new_map
+        # O modelo foi atualizado após a digitação; reabre o popup com as novas sugestões.
+        if self._set_completer_keys(tuple(new_map)) and self.cliente_search_input.hasFocus():
+            self.cliente_completer.complete()
+
+    def _on_clientes_index_loaded(self, gen: int, index: List[Tuple[int, str, str]]):
+        """Slot chamado quando o índice de clientes termina de carregar; ignora cargas obsoletas."""
+        if gen != self._search_gen: return
+        self._clientes_index = index
+        self._index_loading = False
+        self._update_cliente_completer()
+
+    def _on_clientes_index_error(self, gen: int, message: str):
+        """Slot chamado se o carregamento do índice de clientes falhar."""
+        if gen != self._search_gen: return
+        self._index_loading = False
+        print(f"Erro ao buscar clientes para o completer: {message}")
+        self._set_completer_keys(())
+        self.completer_cliente_map.clear()
+
+    def _set_completer_keys(self, keys: Tuple[str, ...]) -> bool:
+        """
+        Atualiza o modelo do completer apenas se a lista de sugestões mudou.
+
+        Returns:
+            bool: True se o modelo foi atualizado, False se as sugestões eram as mesmas.
+        """
+        if keys == self._current_completer_keys:
+            return False
+        self._current_completer_keys = keys
+        self.cliente_completer_model.setStringList(list(keys))
+        return True
 
     def _on_cliente_selected_from_completer(self, text: str):
         cliente_id = self.completer_cliente_map.get(text)
@@ -147,41 +515,35 @@ class EmprestimosTabWidget(QWidget):
             self._reset_state()
 
     def load_emprestimos(self):
-        self.emprestimos_table.setRowCount(0)
-        self.parcelas_table.setRowCount(0)
-        if not self.selected_cliente_id: return
-        emprestimos = self.emprestimo_service.get_emprestimos_by_cliente_id(self.selected_cliente_id)
-        self.emprestimos_table.setRowCount(len(emprestimos))
-        for row, emp in enumerate(emprestimos):
-            self.emprestimos_table.setItem(row, self._EmprestimoTableCols.ID, QTableWidgetItem(str(emp.id)))
-            self.emprestimos_table.setItem(row, self._EmprestimoTableCols.VALOR, QTableWidgetItem(f"R$ {emp.valor:,.2f}"))
-            taxas = f"Simples: {emp.taxa_juros_simples}% | Composto: {emp.taxa_juros_composto}% | Mora: {emp.taxa_juros_mora}%"
-            self.emprestimos_table.setItem(row, self._EmprestimoTableCols.JUROS, QTableWidgetItem(taxas))
-            self.emprestimos_table.setItem(row, self._EmprestimoTableCols.PARCELAS, QTableWidgetItem(str(emp.numero_parcelas)))
-            self.emprestimos_table.setCellWidget(row, self._EmprestimoTableCols.ACOES, self._create_emprestimo_actions(emp))
-
-    def _create_emprestimo_actions(self, emprestimo: Emprestimo) -> QWidget:
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(5, 0, 5, 0)
-        actions_layout.setSpacing(5)
-        btn_ver_parcelas = QPushButton("Parcelas")
-        btn_ver_parcelas.setStyleSheet(styles.get_button_style('imprimir'))
-        btn_ver_parcelas.clicked.connect(lambda _, eid=emprestimo.id: self.load_parcelas(eid))
-        actions_layout.addWidget(btn_ver_parcelas)
-        btn_imprimir = QPushButton("Imprimir")
-        btn_imprimir.setStyleSheet(styles.get_button_style('imprimir'))
-        btn_imprimir.clicked.connect(lambda _, eid=emprestimo.id: self.imprimir_relatorio_emprestimo(eid))
-        actions_layout.addWidget(btn_imprimir)
-        btn_editar = QPushButton("Editar")
-        btn_editar.setStyleSheet(styles.get_button_style('editar'))
-        btn_editar.clicked.connect(lambda _, eid=emprestimo.id: self.edit_emprestimo(eid))
-        actions_layout.addWidget(btn_editar)
-        btn_excluir = QPushButton("Excluir")
-        btn_excluir.setStyleSheet(styles.get_button_style('excluir'))
-        btn_excluir.clicked.connect(lambda _, eid=emprestimo.id, v=emprestimo.valor: self.delete_emprestimo(eid, v))
-        actions_layout.addWidget(btn_excluir)
-        return actions_widget
+        self._clear_parcelas()
+        cliente_id = self.selected_cliente_id
+        if not cliente_id:
+            self._emprestimo_model.clear()
+            return
+        # Reaproveita os empréstimos já carregados se o serviço não registrou
+        # alterações para o cliente desde então.
+        version = self.emprestimo_service.get_version(cliente_id)
+        cached = self._emprestimos_cache.get(cliente_id)
+        if cached is None or cached[0] != version:
+            cached = (version, self.emprestimo_service.get_emprestimos_display_by_cliente_id(cliente_id))
+            self._emprestimos_cache[cliente_id] = cached
+            if len(self._emprestimos_cache) > self._EMPRESTIMOS_CACHE_SIZE:
+                self._emprestimos_cache.popitem(last=False)
+        self._emprestimos_cache.move_to_end(cliente_id)
+        self._emprestimo_model.set_rows(list(cached[1]))
+
+    def _on_emprestimo_action(self, row: int, action: str):
+        """Executa a ação clicada na coluna de ações da tabela de empréstimos."""
+        emprestimo = self._emprestimo_model.row_at(row)
+        emprestimo_id = emprestimo[-1]
+        if action == "parcelas":
+            self.load_parcelas(emprestimo_id)
+        elif action == "imprimir":
+            self.imprimir_relatorio_emprestimo(emprestimo_id)
+        elif action == "editar":
+            self.edit_emprestimo(emprestimo_id)
+        elif action == "excluir":
+            self.delete_emprestimo(emprestimo_id, emprestimo[self._EmprestimoTableCols.VALOR])
 
     def novo_emprestimo(self):
         if not self.selected_cliente_id:
@@ -189,7 +551,10 @@ class EmprestimosTabWidget(QWidget):
             return
         dialog = EmprestimoDialog(self.cliente_service, self.emprestimo_service, parent=self)
         dialog.set_initial_client(self.selected_cliente_id)
-        if dialog.exec():
+        accepted = dialog.exec()
+        # O diálogo permite cadastrar novos clientes, o que invalida o índice de clientes.
+        self._invalidate_clientes_index()
+        if accepted:
             self.load_emprestimos()
 
     def edit_emprestimo(self, emprestimo_id: int):
@@ -200,17 +565,17 @@ class EmprestimosTabWidget(QWidget):
         dialog = EditEmprestimoDialog(emprestimo, self.emprestimo_service, self)
         if dialog.exec():
             self.load_emprestimos()
-            self.parcelas_table.setRowCount(0)
+            self._clear_parcelas()
 
-    def delete_emprestimo(self, emprestimo_id: int, valor_emprestimo: Decimal):
-        reply = QMessageBox.question(self, "Confirmar Exclusão", f"Você tem certeza que deseja excluir o empréstimo de R$ {valor_emprestimo:,.2f} e todas as suas parcelas?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+    def delete_emprestimo(self, emprestimo_id: int, valor_formatado: str):
+        reply = QMessageBox.question(self, "Confirmar Exclusão", f"Você tem certeza que deseja excluir o empréstimo de {valor_formatado} e todas as suas parcelas?", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             auth_dialog = AuthorizationDialog(self.usuario_service, [UserRole.ADMIN], f"excluir o empréstimo ID {emprestimo_id}", self)
             if auth_dialog.exec():
                 self.emprestimo_service.delete_emprestimo(emprestimo_id)
                 QMessageBox.information(self, "Sucesso", "Empréstimo excluído com sucesso.")
                 self.load_emprestimos()
-                self.parcelas_table.setRowCount(0)
+                self._clear_parcelas()
 
     def imprimir_relatorio_emprestimo(self, emprestimo_id: int):
         relatorio_html = self.emprestimo_service.gerar_relatorio_html_emprestimo(emprestimo_id)
@@ -222,33 +587,25 @@ class EmprestimosTabWidget(QWidget):
 
     def load_parcelas(self, emprestimo_id: int):
         self.current_emprestimo_id_for_parcelas = emprestimo_id
+        key = (emprestimo_id, self.emprestimo_service.get_version(self.selected_cliente_id))
+        if key == self._parcelas_loaded_key:
+            return  # As parcelas exibidas já estão atualizadas
         parcelas = self.emprestimo_service.get_parcelas_by_emprestimo_id(emprestimo_id)
-        self.parcelas_table.setRowCount(len(parcelas))
-        for row, parcela in enumerate(parcelas):
-            self.parcelas_table.setItem(row, self._ParcelaTableCols.NUMERO, QTableWidgetItem(str(parcela.numero)))
-            self.parcelas_table.setItem(row, self._ParcelaTableCols.VALOR, QTableWidgetItem(f"R$ {parcela.valor:,.2f}"))
-            self.parcelas_table.setItem(row, self._ParcelaTableCols.VENCIMENTO, QTableWidgetItem(parcela.data_vencimento.strftime('%d/%m/%Y')))
-            status_item = QTableWidgetItem("Sim" if parcela.pago else "Não")
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.parcelas_table.setItem(row, self._ParcelaTableCols.PAGO, status_item)
-            self.parcelas_table.setCellWidget(row, self._ParcelaTableCols.ACOES, self._create_parcela_actions(parcela))
-
-    def _create_parcela_actions(self, parcela: Parcela) -> QWidget:
-        actions_widget = QWidget()
-        actions_layout = QHBoxLayout(actions_widget)
-        actions_layout.setContentsMargins(5, 0, 5, 0)
-        actions_layout.setSpacing(5)
-        btn_editar = QPushButton("Editar")
-        btn_editar.setStyleSheet(styles.get_button_style('editar'))
-        btn_editar.setEnabled(not parcela.pago)
-        btn_editar.clicked.connect(lambda _, pid=parcela.id: self.edit_parcela(pid))
-        actions_layout.addWidget(btn_editar)
-        btn_pagar = QPushButton("Registrar Pagamento")
-        btn_pagar.setStyleSheet(styles.get_button_style('pagar'))
-        btn_pagar.setEnabled(not parcela.pago)
-        btn_pagar.clicked.connect(lambda _, pid=parcela.id: self.registrar_pagamento(pid))
-        actions_layout.addWidget(btn_pagar)
-        return actions_widget
+        self._parcela_model.set_rows(parcelas)
+        self._parcelas_loaded_key = key
+
+    def _clear_parcelas(self):
+        """Limpa a tabela de parcelas."""
+        self._parcela_model.clear()
+        self._parcelas_loaded_key = None
+
+    def _on_parcela_action(self, row: int, action: str):
+        """Executa a ação clicada na coluna de ações da tabela de parcelas."""
+        parcela: Parcela = self._parcela_model.row_at(row)
+        if action == "editar":
+            self.edit_parcela(parcela.id)
+        elif action == "pagar":
+            self.registrar_pagamento(parcela.id)
 
     def edit_parcela(self, parcela_id: int):
         if not self._request_authorization(f"editar a parcela Nº {parcela_id}"): return
@@ -267,14 +624,34 @@ class EmprestimosTabWidget(QWidget):
         parcela_atualizada = self.emprestimo_service.registrar_pagamento_parcela(parcela_id)
         if parcela_atualizada:
             QMessageBox.information(self, "Pagamento Registrado", "Pagamento registrado com sucesso.")
-            self.load_parcelas(parcela_atualizada.emprestimo_id)
+            # Apenas a parcela paga mudou; atualiza somente a sua linha.
+            row = self._parcela_model.find_row(parcela_id)
+            if row is not None:
+                self._parcela_model.update_row(row, parcela_atualizada)
+                self._parcelas_loaded_key = (parcela_atualizada.emprestimo_id,
+                                             self.emprestimo_service.get_version(self.selected_cliente_id))
+            else:
+                self.load_parcelas(parcela_atualizada.emprestimo_id)
         else:
             QMessageBox.warning(self, "Aviso", "A parcela não foi encontrada ou já estava paga.")
 
     def _request_authorization(self, action_name: str) -> bool:
+        """
+        Solicita a autorização de um usuário qualificado para a ação.
+
+        Uma autorização concedida é reaproveitada por `_AUTH_TTL` segundos,
+        evitando repetir o diálogo (e a verificação da senha) em operações
+        consecutivas sobre as parcelas.
+        """
         allowed_roles = [UserRole.ADMIN, UserRole.OPERADOR]
+        key = frozenset(allowed_roles)
+        if time.monotonic() < self._auth_cache.get(key, 0):
+            return True
         auth_dialog = AuthorizationDialog(self.usuario_service, allowed_roles, action_name, self)
-        return auth_dialog.exec()
+        if not auth_dialog.exec():
+            return False
+        self._auth_cache[key] = time.monotonic() + self._AUTH_TTL
+        return True
 
     def _show_parcela_context_menu(self, pos):
         if self.parcelas_table.rowAt(pos.y()) < 0: return
@@ -290,13 +667,20 @@ class EmprestimosTabWidget(QWidget):
     def _reset_state(self):
         """Limpa o estado da aba, preparando-a para uma nova consulta."""
         self.selected_cliente_id = None
+        self.cliente_search_timer.stop()
         self.cliente_search_input.blockSignals(True)
         self.cliente_search_input.clear()
         self.cliente_search_input.blockSignals(False)
         self.selected_cliente_label.setText("Nenhum cliente selecionado.")
-        self.emprestimos_table.setRowCount(0)
-        self.parcelas_table.setRowCount(0)
+        self._emprestimo_model.clear()
+        self._clear_parcelas()
 
     def refresh_data(self):
         """Método público para ser chamado quando a aba se torna visível."""
-        self._reset_state()
\ No newline at end of file
+        # Clientes podem ter sido criados ou alterados em outras abas.
+        self._invalidate_clientes_index()
+        self._reset_state()
+
+    def invalidate_cache(self):
+        """Descarta os empréstimos em cache, após alterações feitas fora do serviço (ex: restauração)."""
+        self._emprestimos_cache.clear()
\ No newline at end of file
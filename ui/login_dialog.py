@@ -2,12 +2,15 @@
 
 from typing import Optional
 
-from PyQt6.QtCore import Qt
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QThreadPool
 from PyQt6.QtWidgets import (QApplication, QDialog, QDialogButtonBox, QLabel,
                              QLineEdit, QMessageBox, QVBoxLayout)
+from sqlalchemy.orm import Session
 
 from models.usuario import Usuario
 from services.usuario_service import UsuarioService
+from .workers import Worker
 
 
 class LoginDialog(QDialog):
@@ -21,6 +24,8 @@ class LoginDialog(QDialog):
         super().__init__(parent)
         self.usuario_service = usuario_service
         self.usuario_logado: Optional[Usuario] = None
+        # Indica uma verificação em andamento no QThreadPool (ver reject)
+        self._verifying = False
 
         self.setWindowTitle("Login do Sistema")
         self.setModal(True)
@@ -44,7 +49,7 @@ class LoginDialog(QDialog):
         # --- Widget de Status (Carregando) ---
         self.status_label = QLabel("Verificando credenciais...")
         self.status_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.status_label.setStyleSheet("color: #555;")
+        self.status_label.setObjectName("loginStatus")  # Estilo em styles.DIALOG_LABEL_STYLE
         self.status_label.hide()  # Oculto inicialmente
         layout.addWidget(self.status_label)
 
@@ -74,22 +79,74 @@ class LoginDialog(QDialog):
         self.status_label.show()
         QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
 
+        # A verificação da senha (bcrypt) roda no QThreadPool para que a UI
+        # continue respondendo e o status "Verificando..." seja exibido.
+        self._verifying = True
+        worker = Worker(self._verify_in_background, email, senha)
+        worker.signals.finished.connect(self._on_login_verified)
+        worker.signals.error.connect(self._on_login_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _verify_in_background(self, email: str, senha: str) -> Optional[int]:
+        """
+        Verifica as credenciais fora da thread da interface.
+
+        A sessão da interface não pode ser compartilhada entre threads, então a
+        consulta usa uma sessão própria e de curta duração, ligada ao mesmo banco.
+
+        Returns:
+            Optional[int]: O ID do usuário autenticado, ou None se as credenciais forem inválidas.
+        """
+        session = Session(bind=self.usuario_service.db_session.get_bind())
         try:
-            authenticated_user = self.usuario_service.verify_credentials(email, senha)
-            if authenticated_user:
-                self.usuario_logado = authenticated_user
-                super().accept()  # Fecha o diálogo com sucesso
-            else:
-                QMessageBox.warning(self, "Login Falhou", "Email ou senha incorretos.")
-                self._set_ui_enabled(True)
-                self.senha_input.clear()
-                self.senha_input.setFocus()
-        except Exception as e:
-            QMessageBox.critical(self, "Erro de Login", f"Ocorreu um erro inesperado: {e}")
-            self._set_ui_enabled(True)
+            usuario = UsuarioService(session).verify_credentials(email, senha)
+            return usuario.id if usuario else None
         finally:
-            self.status_label.hide()
-            QApplication.restoreOverrideCursor()
+            session.close()
+
+    def reject(self):
+        """Impede que o diálogo seja fechado (Esc/Cancelar) durante uma verificação."""
+        if self._verifying:
+            return
+        super().reject()
+
+    def _finish_login_attempt(self) -> bool:
+        """
+        Restaura o cursor ao fim da verificação.
+
+        Returns:
+            bool: False se o diálogo foi fechado ou destruído durante a verificação.
+        """
+        QApplication.restoreOverrideCursor()
+        if sip.isdeleted(self):
+            return False
+        self._verifying = False
+        if not self.isVisible():
+            return False
+        self.status_label.hide()
+        return True
+
+    def _on_login_verified(self, usuario_id: Optional[int]):
+        """Slot chamado quando a verificação das credenciais termina."""
+        if not self._finish_login_attempt():
+            return
+        # O usuário é carregado pela sessão da interface, usada pela janela principal.
+        authenticated_user = self.usuario_service.get_usuario_by_id(usuario_id) if usuario_id else None
+        if authenticated_user:
+            self.usuario_logado = authenticated_user
+            super().accept()  # Fecha o diálogo com sucesso
+        else:
+            QMessageBox.warning(self, "Login Falhou", "Email ou senha incorretos.")
+            self._set_ui_enabled(True)
+            self.senha_input.clear()
+            self.senha_input.setFocus()
+
+    def _on_login_error(self, message: str):
+        """Slot chamado se a verificação das credenciais falhar com uma exceção."""
+        if not self._finish_login_attempt():
+            return
+        QMessageBox.critical(self, "Erro de Login", f"Ocorreu um erro inesperado: {message}")
+        self._set_ui_enabled(True)
 
     def get_authenticated_user(self) -> Optional[Usuario]:
         """Retorna o objeto do usuário se a autenticação foi bem-sucedida."""
@@ -9,8 +9,12 @@ Esta classe é responsável por:
 - Orquestrar a abertura de diálogos para criação, edição e visualização de dados.
 """
 import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import Qt, QThreadPool, QTimer
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QMessageBox, QTabWidget, QFileDialog
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QMessageBox, QTabWidget, QFileDialog,
+    QProgressDialog
 )
 from sqlalchemy.orm import Session
 from services.emprestimo_service import EmprestimoService
@@ -23,7 +27,11 @@ from .clientes_tab_widget import ClientesTabWidget
 from .usuarios_tab_widget import UsuariosTabWidget
 from .emprestimos_tab_widget import EmprestimosTabWidget
 from .dashboard_static import DashboardStatic
-from backup_utils import BackupManager
+from .deferred_refresh import DeferredRefreshMixin
+from .workers import Worker
+
+if TYPE_CHECKING:
+    from backup_utils import BackupManager
 
 class MainWindow(QMainWindow):
     """
@@ -31,12 +39,9 @@ class MainWindow(QMainWindow):
     """
     @property
     def is_admin(self) -> bool:
-        """Verifica se o usuário logado é um administrador."""
-        # Acesso seguro para evitar AttributeError se o objeto não for o esperado
-        return getattr(self.usuario_logado, 'role', None) and self.usuario_logado.role.value == 'admin'
+        """Verifica se o usuário logado é um administrador (calculado uma vez no __init__)."""
+        return self._is_admin
 
-    # --- Constantes para Colunas das Tabelas ---
-    # Usar constantes em vez de números mágicos torna o código mais legível e fácil de manter.
     def __init__(self, usuario_logado: Usuario, db_session: Session):
         """
         Inicializa a janela principal da aplicação.
@@ -52,9 +57,19 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.usuario_logado = usuario_logado
+        # O perfil não muda durante a sessão: o valor é copiado uma única vez para
+        # uma string simples, evitando acessos ao ORM (e falhas se o objeto for
+        # desanexado da sessão). Acesso seguro para evitar AttributeError.
+        self._role_value: Optional[str] = getattr(getattr(usuario_logado, 'role', None), 'value', None)
+        self._is_admin = self._role_value == 'admin'
         self.db_session = db_session
         self.setWindowTitle(f"Gestor System - Usuário: {self.usuario_logado.nome}")
         self.setGeometry(100, 100, 1200, 700)
+        # Estado do fechamento com backup em segundo plano (ver closeEvent)
+        self._exit_backup_running = False
+        self._close_confirmed = False
+        self._threads_stopped = False
+        self._backup_manager: Optional['BackupManager'] = None
 
         # Inicializa os serviços com a sessão do banco de dados
         self.cliente_service = ClienteService(self.db_session)
@@ -64,6 +79,7 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.layout = QVBoxLayout(self.central_widget)
 
+        self._setup_refresh_timer()
         self.setup_ui()
 
         if self.is_admin:
@@ -72,6 +88,14 @@ class MainWindow(QMainWindow):
             restore_action = self.menu_admin.addAction("Restaurar Backup...")
             restore_action.triggered.connect(self.iniciar_restauracao)
 
+    def _setup_refresh_timer(self):
+        """Configura o timer para debouncing da atualização ao trocar de aba."""
+        self._pending_index = -1
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(150)  # Atraso de 150ms
+        self._refresh_timer.timeout.connect(self._do_refresh_current)
+
     def setup_ui(self):
         """Cria e organiza os widgets da interface usando abas."""
         self.tabs = QTabWidget()
@@ -89,39 +113,102 @@ class MainWindow(QMainWindow):
         )
         self.tabs.addTab(self.dashboard_tab, "Dashboard")
 
+        # Abas reais já construídas e o callback de atualização de cada uma,
+        # indexado pelo id da página da aba para despacho direto em on_tab_changed.
+        self._registered_tabs: List[QWidget] = []
+        self._refresh_by_widget: Dict[int, Callable[[], None]] = {}
+        self._register_tab(self.dashboard_tab)
+
+        # As demais abas começam como placeholders vazios e só são construídas
+        # (com suas consultas ao banco) na primeira vez em que são exibidas.
+        # placeholder -> (nome do atributo, fábrica da aba real)
+        self._tab_factories: Dict[QWidget, Tuple[str, Callable[[], QWidget]]] = {}
+
         # Aba de Usuários (somente para admins)
         if self.is_admin:
-            self.usuarios_tab = UsuariosTabWidget(self.usuario_service, self.usuario_logado, self.db_session, parent=self)
-            self.tabs.addTab(self.usuarios_tab, "Usuários")
+            self._add_lazy_tab("usuarios_tab", "Usuários", lambda: UsuariosTabWidget(
+                self.usuario_service, self.usuario_logado, self.db_session, parent=self
+            ))
 
         # Aba de Clientes
-        self.clientes_tab = ClientesTabWidget(
+        self._add_lazy_tab("clientes_tab", "Clientes", lambda: ClientesTabWidget(
             cliente_service=self.cliente_service,
             db_session=self.db_session,
-            user_role=self.usuario_logado.role.value,
+            user_role=self._role_value,
             parent=self
-        )
-        self.tabs.addTab(self.clientes_tab, "Clientes")
+        ))
 
         # Aba de Empréstimos (somente para admins)
         if self.is_admin:
-            self.emprestimos_tab = EmprestimosTabWidget(
+            self._add_lazy_tab("emprestimos_tab", "Empréstimos", lambda: EmprestimosTabWidget(
                 usuario_logado=self.usuario_logado,
                 emprestimo_service=self.emprestimo_service,
                 cliente_service=self.cliente_service,
                 usuario_service=self.usuario_service,
                 parent=self
-            )
-            self.tabs.addTab(self.emprestimos_tab, "Empréstimos")
+            ))
 
         self.tabs.currentChanged.connect(self.on_tab_changed)
 
+    def _register_tab(self, widget: QWidget, page: Optional[QWidget] = None):
+        """
+        Registra uma aba construída para o despacho de atualização e o encerramento.
+
+        Args:
+            widget (QWidget): O widget real da aba.
+            page (Optional[QWidget]): A página do QTabWidget que contém o widget,
+                quando diferente dele (abas preguiçosas).
+        """
+        self._registered_tabs.append(widget)
+        if isinstance(widget, DeferredRefreshMixin):
+            self._refresh_by_widget[id(page or widget)] = widget.refresh_on_tab_change
+
+    def _add_lazy_tab(self, attr_name: str, title: str, factory: Callable[[], QWidget]):
+        """
+        Adiciona uma aba cujo widget real só é criado quando ela é exibida.
+
+        Args:
+            attr_name (str): Nome do atributo da janela que receberá o widget real.
+            title (str): O título da aba.
+            factory (Callable[[], QWidget]): Função que constrói o widget real.
+        """
+        placeholder = QWidget()
+        placeholder_layout = QVBoxLayout(placeholder)
+        placeholder_layout.setContentsMargins(0, 0, 0, 0)
+        self._tab_factories[placeholder] = (attr_name, factory)
+        self.tabs.addTab(placeholder, title)
+
+    def _build_lazy_tab(self, index: int) -> Optional[QWidget]:
+        """
+        Constrói o widget real dentro do placeholder da aba, se ainda não construído.
+
+        O placeholder permanece como página do QTabWidget; trocar a página com
+        removeTab/insertTab tornaria a aba vizinha corrente por um instante e
+        poderia disparar a atualização pendente de uma aba que o usuário não abriu.
+
+        Returns:
+            Optional[QWidget]: O widget recém-construído, ou None se a aba já estava pronta.
+        """
+        placeholder = self.tabs.widget(index)
+        entry = self._tab_factories.pop(placeholder, None)
+        if entry is None:
+            return None
+        attr_name, factory = entry
+        widget = factory()
+        setattr(self, attr_name, widget)
+        placeholder.layout().addWidget(widget)
+        self._register_tab(widget, page=placeholder)
+        return widget
+
     def _handle_novo_emprestimo_shortcut(self):
         """Abre o diálogo de novo empréstimo a partir do atalho do dashboard."""
         dialog = EmprestimoDialog(self.cliente_service, self.emprestimo_service, parent=self)
         if dialog.exec():
-            # Recarrega os dados do dashboard para refletir o novo empréstimo
-            self.dashboard_tab.refresh()
+            # Marca as abas afetadas; cada uma só recarrega quando estiver visível.
+            self.dashboard_tab.mark_dirty()
+            emprestimos_tab = getattr(self, 'emprestimos_tab', None)
+            if emprestimos_tab:
+                emprestimos_tab.mark_dirty()
 
     def _handle_relatorios_shortcut(self):
         """Placeholder para a funcionalidade de relatórios."""
@@ -141,15 +228,23 @@ class MainWindow(QMainWindow):
         Inicia o processo de restauração de um backup, com múltiplas confirmações
         para garantir a segurança da operação.
         """
-        # 1. Abre o diálogo para selecionar o arquivo de backup
-        backup_file_path, _ = QFileDialog.getOpenFileName(
-            self,
+        # 1. Abre o diálogo para selecionar o arquivo de backup, sem bloquear o
+        #    loop de eventos. A continuação acontece em `_on_restore_file_chosen`.
+        self._open_file_dialog(
             "Selecione o Arquivo de Backup para Restaurar",
-            "",  # Diretório inicial
-            "Arquivos de Backup (*.sql *.db);;Todos os Arquivos (*)"
+            QFileDialog.FileMode.ExistingFile,
+            self._on_restore_file_chosen,
+            name_filter="Arquivos de Backup (*.sql *.db);;Todos os Arquivos (*)",
         )
 
-        # 2. Se o usuário cancelou, sai do método
+    def _on_restore_file_chosen(self, backup_file_path: str):
+        """
+        Slot chamado quando o usuário escolhe o arquivo de backup a restaurar.
+
+        Args:
+            backup_file_path (str): O caminho do arquivo selecionado.
+        """
+        # 2. Se nenhum arquivo foi escolhido, sai do método
         if not backup_file_path:
             return
 
@@ -168,16 +263,117 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.StandardButton.No:
             return
 
-        # 5. Se o usuário confirmou, executa a restauração
-        try:
-            backup_manager = BackupManager()
-            success, message = backup_manager.perform_restore(backup_file_path)
-            if success:
-                QMessageBox.information(self, "Restauração Concluída", message)
-            else:
-                QMessageBox.critical(self, "Falha na Restauração", message)
-        except Exception as e:
-            QMessageBox.critical(self, "Erro na Restauração", f"Ocorreu um erro inesperado: {e}")
+        # 5. Se o usuário confirmou, executa a restauração em segundo plano
+        self._run_in_background(
+            "Restaurando o backup, aguarde...",
+            self._restore_backup, backup_file_path,
+            on_finished=self._on_restore_finished,
+            on_error=lambda message: QMessageBox.critical(
+                self, "Erro na Restauração", f"Ocorreu um erro inesperado: {message}"),
+        )
+
+    def _open_file_dialog(self, title: str, file_mode: QFileDialog.FileMode,
+                          on_selected: Callable[[str], None],
+                          on_cancelled: Optional[Callable[[], None]] = None,
+                          name_filter: Optional[str] = None):
+        """
+        Abre um QFileDialog não bloqueante.
+
+        Ao contrário de `QFileDialog.getOpenFileName` e similares, o método retorna
+        imediatamente: o loop de eventos principal continua rodando (ex: o relógio)
+        e o caminho escolhido é entregue a `on_selected`.
+
+        Args:
+            title (str): O título do diálogo.
+            file_mode (QFileDialog.FileMode): O modo de seleção (arquivo ou pasta).
+            on_selected (Callable[[str], None]): Chamado com o caminho escolhido.
+            on_cancelled (Optional[Callable[[], None]]): Chamado se o usuário cancelar.
+            name_filter (Optional[str]): O filtro de tipos de arquivo.
+        """
+        dialog = QFileDialog(self, title)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.setFileMode(file_mode)
+        if file_mode == QFileDialog.FileMode.Directory:
+            dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        if name_filter:
+            dialog.setNameFilter(name_filter)
+        dialog.fileSelected.connect(on_selected)
+        if on_cancelled:
+            dialog.rejected.connect(on_cancelled)
+        dialog.open()
+
+    def _on_restore_finished(self, result: Tuple[bool, str]):
+        """Slot chamado ao fim da restauração em segundo plano."""
+        success, message = result
+        if success:
+            # Os dados foram substituídos: descarta o que a sessão e as abas têm em memória.
+            self.db_session.expire_all()
+            for tab_widget in self._registered_tabs:
+                if hasattr(tab_widget, 'invalidate_cache'):
+                    tab_widget.invalidate_cache()
+                if isinstance(tab_widget, DeferredRefreshMixin):
+                    tab_widget.mark_dirty()
+            QMessageBox.information(self, "Restauração Concluída", message)
+        else:
+            QMessageBox.critical(self, "Falha na Restauração", message)
+
+    def _get_backup_manager(self) -> 'BackupManager':
+        """
+        Retorna o BackupManager da janela, criando-o no primeiro uso.
+
+        O módulo `backup_utils` (e o python-dotenv) só é importado aqui, na
+        primeira operação de backup/restauração, e não na inicialização.
+
+        Operações de backup/restauração nunca rodam em paralelo (o diálogo de
+        progresso é modal), então a criação preguiçosa não precisa de trava.
+        """
+        if self._backup_manager is None:
+            from backup_utils import BackupManager
+            self._backup_manager = BackupManager()
+        return self._backup_manager
+
+    def _restore_backup(self, backup_file_path: str) -> Tuple[bool, str]:
+        """Executa a restauração do backup. Chamado fora da thread da interface."""
+        return self._get_backup_manager().perform_restore(backup_file_path)
+
+    def _create_backup(self, backup_dir: str) -> Tuple[bool, str]:
+        """Executa o backup do banco de dados. Chamado fora da thread da interface."""
+        return self._get_backup_manager().perform_backup(backup_dir)
+
+    def _run_in_background(self, label: str, fn: Callable, *args,
+                           on_finished: Callable[[Any], None], on_error: Callable[[str], None]):
+        """
+        Executa uma operação demorada no QThreadPool exibindo um diálogo de progresso.
+
+        O diálogo é indeterminado e não pode ser cancelado: backups e restaurações
+        são executados por utilitários externos (pg_dump, psql, mysql...) que não
+        podem ser interrompidos com segurança no meio da operação.
+
+        Args:
+            label (str): O texto exibido no diálogo de progresso.
+            fn (Callable): A função a ser executada em segundo plano.
+            *args: Argumentos repassados para a função.
+            on_finished (Callable[[Any], None]): Chamado com o retorno da função em caso de sucesso.
+            on_error (Callable[[str], None]): Chamado com a mensagem de erro em caso de exceção.
+        """
+        progress = QProgressDialog(label, None, 0, 0, self)
+        progress.setWindowTitle("Aguarde")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+        progress.show()
+
+        def finished(result):
+            progress.close()
+            on_finished(result)
+
+        def error(message: str):
+            progress.close()
+            on_error(message)
+
+        worker = Worker(fn, *args)
+        worker.signals.finished.connect(finished)
+        worker.signals.error.connect(error)
+        QThreadPool.globalInstance().start(worker)
 
     def on_tab_changed(self, index):
         """
@@ -189,32 +385,52 @@ class MainWindow(QMainWindow):
         Args:
             index (int): O índice da nova aba selecionada.
         """
-        current_widget = self.tabs.widget(index)
-        if current_widget is self.dashboard_tab:
-            self.dashboard_tab.refresh()
-        elif current_widget is self.clientes_tab:
-            self.clientes_tab.refresh_data()
-        elif self.is_admin:
-            if current_widget is self.usuarios_tab:
-                self.usuarios_tab.refresh_data()
-            elif current_widget is self.emprestimos_tab:
-                self.emprestimos_tab.refresh_data()
+        # Trocas rápidas de aba são agrupadas: só a aba em que o usuário para é atualizada.
+        self._pending_index = index
+        self._refresh_timer.start()
+
+    def _do_refresh_current(self):
+        """Constrói ou atualiza a aba selecionada após o intervalo de debounce."""
+        index = self._pending_index
+        if index != self.tabs.currentIndex():
+            return
+        if self._build_lazy_tab(index) is not None:
+            return  # A aba acabou de ser construída e já está com os dados atualizados
+
+        # A aba exibida já está visível: é atualizada agora, a menos que o showEvent
+        # já tenha feito isso ao exibi-la.
+        refresh = self._refresh_by_widget.get(id(self.tabs.widget(index)))
+        if refresh:
+            refresh()
 
     def _shutdown_threads(self):
-        """Itera sobre as abas conhecidas e chama o método stop_threads se existir."""
+        """
+        Encerra os threads das abas conhecidas e aguarda as tarefas do QThreadPool.
+
+        Primeiro todas as abas recebem o pedido de parada e só depois a janela
+        espera por elas, de modo que as esperas acontecem em paralelo. Chamadas
+        seguintes não fazem nada.
+        """
+        if self._threads_stopped:
+            return
         logging.info("Iniciando o encerramento dos threads das abas...")
-        
-        tabs_with_threads = [
-            getattr(self, 'clientes_tab', None),
-            getattr(self, 'usuarios_tab', None),
-            getattr(self, 'emprestimos_tab', None)
-        ]
-
-        for tab_widget in tabs_with_threads:
-            if tab_widget and hasattr(tab_widget, 'stop_threads'):
+
+        # 1ª passagem: sinaliza a parada de todos os threads, sem esperar.
+        for tab_widget in self._registered_tabs:
+            if hasattr(tab_widget, 'request_stop_threads'):
+                logging.info(f"Encerrando thread para {tab_widget.__class__.__name__}...")
+                tab_widget.request_stop_threads()
+            elif hasattr(tab_widget, 'stop_threads'):
                 logging.info(f"Encerrando thread para {tab_widget.__class__.__name__}...")
                 tab_widget.stop_threads()
 
+        # 2ª passagem: aguarda todos terminarem.
+        for tab_widget in self._registered_tabs:
+            if hasattr(tab_widget, 'join_threads'):
+                tab_widget.join_threads(timeout_ms=2000)
+        QThreadPool.globalInstance().waitForDone(2000)
+        self._threads_stopped = True
+
     def closeEvent(self, event) -> None:
         """
         Sobrescreve o evento de fechamento da janela.
@@ -222,10 +438,27 @@ class MainWindow(QMainWindow):
         Primeiro, pergunta ao usuário se deseja fazer um backup. Em seguida,
         garante que todos os threads em segundo plano sejam encerrados com segurança
         antes de permitir que a aplicação feche, prevenindo o erro 'QThread destroyed'.
+        Se o backup for solicitado, ele é executado em segundo plano e a janela
+        só é fechada quando ele terminar.
 
         Args:
             event (QCloseEvent): O evento de fechamento.
         """
+        if self._close_confirmed:
+            self._shutdown_threads()
+            event.accept()
+            return
+        if self._exit_backup_running:
+            event.ignore()  # O backup de saída ainda está em andamento
+            return
+
+        # Encerramento não interativo (modo --quiet ou encerramento da aplicação
+        # pelo sistema): fecha sem perguntar sobre o backup.
+        if QApplication.instance().property("quiet_exit") or (not event.spontaneous() and QApplication.closingDown()):
+            self._shutdown_threads()
+            event.accept()
+            return
+
         reply = QMessageBox.question(
             self,
             "Confirmar Saída",
@@ -238,24 +471,53 @@ class MainWindow(QMainWindow):
             event.ignore()
             return
 
-        # Se o usuário não cancelou, encerra os threads antes de prosseguir.
-        self._shutdown_threads()
-
         if reply == QMessageBox.StandardButton.Yes:
-            backup_dir = QFileDialog.getExistingDirectory(self, "Selecione a Pasta para Salvar o Backup")
-            if backup_dir:
-                try:
-                    backup_manager = BackupManager()
-                    success, message = backup_manager.perform_backup(backup_dir)
-                    if success:
-                        QMessageBox.information(self, "Backup Concluído", message)
-                    else:
-                        QMessageBox.critical(self, "Falha no Backup", message)
-                except Exception as e:
-                    QMessageBox.critical(self, "Erro no Backup", f"Ocorreu um erro inesperado: {e}")
-                finally:
-                    event.accept()
-            else:
-                event.ignore()
+            # A escolha da pasta e o backup acontecem sem bloquear o loop de eventos;
+            # a janela só fecha quando o backup terminar.
+            event.ignore()
+            self._exit_backup_running = True  # Impede novos pedidos de fechamento enquanto isso
+            self._open_file_dialog(
+                "Selecione a Pasta para Salvar o Backup",
+                QFileDialog.FileMode.Directory,
+                self._on_exit_backup_dir_chosen,
+                on_cancelled=self._on_exit_backup_cancelled,
+            )
         else:  # reply == QMessageBox.StandardButton.No
-            event.accept()
\ No newline at end of file
+            self._shutdown_threads()
+            event.accept()
+
+    def _on_exit_backup_dir_chosen(self, backup_dir: str):
+        """Slot chamado quando o usuário escolhe a pasta do backup de saída."""
+        if not backup_dir:
+            self._on_exit_backup_cancelled()
+            return
+        self._run_in_background(
+            "Gerando backup do banco de dados, aguarde...",
+            self._create_backup, backup_dir,
+            on_finished=self._on_exit_backup_finished,
+            on_error=self._on_exit_backup_error,
+        )
+
+    def _on_exit_backup_cancelled(self):
+        """Slot chamado se o usuário cancelar a escolha da pasta; a janela permanece aberta."""
+        self._exit_backup_running = False
+
+    def _on_exit_backup_finished(self, result: Tuple[bool, str]):
+        """Slot chamado ao fim do backup de saída; informa o resultado e fecha a janela."""
+        success, message = result
+        if success:
+            QMessageBox.information(self, "Backup Concluído", message)
+        else:
+            QMessageBox.critical(self, "Falha no Backup", message)
+        self._finish_close()
+
+    def _on_exit_backup_error(self, message: str):
+        """Slot chamado se o backup de saída falhar com uma exceção."""
+        QMessageBox.critical(self, "Erro no Backup", f"Ocorreu um erro inesperado: {message}")
+        self._finish_close()
+
+    def _finish_close(self):
+        """Fecha a janela após o backup de saída, sem perguntar novamente."""
+        self._exit_backup_running = False
+        self._close_confirmed = True
+        self.close()
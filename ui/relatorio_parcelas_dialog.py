@@ -1,8 +1,11 @@
 # ui/relatorio_parcelas_dialog.py
 
-from PyQt6.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QDialogButtonBox, QPushButton, QMessageBox
+from PyQt6.QtWidgets import QApplication, QDialog, QVBoxLayout, QTextEdit, QDialogButtonBox, QPushButton, QMessageBox
 from PyQt6.QtPrintSupport import QPrinter, QPrintDialog
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QThread, QThreadPool
+from PyQt6.QtGui import QTextDocument
+
+from .workers import Worker
 
 class RelatorioParcelasDialog(QDialog):
     """
@@ -19,7 +22,7 @@ class RelatorioParcelasDialog(QDialog):
         # --- Editor de Texto para exibir o HTML ---
         self.text_edit = QTextEdit()
         self.text_edit.setReadOnly(True)
-        self.text_edit.setHtml(relatorio_html)
+        self.text_edit.setPlainText("Carregando relatório...")
         layout.addWidget(self.text_edit)
 
         # --- Botões ---
@@ -27,6 +30,7 @@ class RelatorioParcelasDialog(QDialog):
         
         # Botão de Imprimir
         self.print_button = QPushButton("Imprimir")
+        self.print_button.setEnabled(False)  # Habilitado quando o relatório terminar de carregar
         self.print_button.clicked.connect(self.imprimir_relatorio)
         self.button_box.addButton(self.print_button, QDialogButtonBox.ButtonRole.ActionRole)
 
@@ -36,10 +40,41 @@ class RelatorioParcelasDialog(QDialog):
 
         layout.addWidget(self.button_box)
 
+        # O parsing do HTML é feito em segundo plano para não atrasar a abertura do diálogo.
+        worker = Worker(self._build_document, relatorio_html, QApplication.instance().thread())
+        worker.signals.finished.connect(self._on_document_ready)
+        worker.signals.error.connect(self._on_document_error)
+        QThreadPool.globalInstance().start(worker)
+
+    @staticmethod
+    def _build_document(relatorio_html: str, gui_thread: QThread) -> QTextDocument:
+        """
+        Converte o HTML do relatório em um QTextDocument.
+
+        Executado fora da thread da interface; o documento é movido para a
+        thread da interface antes de ser entregue, para poder ser exibido.
+        """
+        document = QTextDocument()
+        document.setHtml(relatorio_html)
+        document.moveToThread(gui_thread)
+        return document
+
+    def _on_document_ready(self, document: QTextDocument):
+        """Slot chamado quando o documento do relatório termina de ser montado."""
+        document.setParent(self)
+        self.text_edit.setDocument(document)
+        self.print_button.setEnabled(True)
+
+    def _on_document_error(self, message: str):
+        """Slot chamado se a montagem do documento do relatório falhar."""
+        self.text_edit.setPlainText("")
+        QMessageBox.critical(self, "Erro no Relatório", f"Não foi possível carregar o relatório: {message}")
+
     def imprimir_relatorio(self):
         """Abre o diálogo de impressão do sistema."""
         printer = QPrinter(QPrinter.PrinterMode.HighResolution)
         dialog = QPrintDialog(printer, self)
 
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.text_edit.print(printer)
\ No newline at end of file
+            # Imprime direto do documento já montado, sem passar pelo widget.
+            self.text_edit.document().print(printer)
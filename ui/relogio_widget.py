@@ -1,28 +1,44 @@
 # ui/relogio_widget.py
 
-from PyQt6.QtWidgets import QLCDNumber
+from PyQt6.QtWidgets import QLabel
 from PyQt6.QtCore import QTime, QTimer, Qt
-from . import styles
-from PyQt6 import QtWidgets
+from PyQt6.QtGui import QFont
 
-class RelogioWidget(QLCDNumber):
+class RelogioWidget(QLabel):
     """
     Um widget de relógio digital que exibe a hora atual com um efeito de 'dois pontos' piscando.
     """
+    # Formatos alternados a cada segundo para o efeito de piscar
+    _FMT_EVEN = 'hh:mm:ss'
+    _FMT_ODD = 'hh mm ss'
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
-        self.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        self.setSegmentStyle(QLCDNumber.SegmentStyle.Filled)
-        self.setDigitCount(8)
+        # Fonte monoespaçada: os dois formatos têm a mesma largura e o texto não "pula"
+        # ao alternar. É bem mais leve que redesenhar os segmentos de um QLCDNumber.
+        font = QFont("DejaVu Sans Mono", 24, QFont.Weight.Bold)
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        self.setFont(font)
+        self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setFixedSize(200, 60)
-        self.setStyleSheet(styles.RELOGIO_STYLE)
+        self.setObjectName("relogio")  # Estilo em styles.RELOGIO_STYLE
+
+        self._last_text = ""
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)  # Precisão de 1s é suficiente
+        self._timer.timeout.connect(self._mostrar_hora)
 
-        timer = QTimer(self)
-        timer.timeout.connect(self._mostrar_hora)
-        timer.start(1000)
+        # Alinha o timer com a virada do próximo segundo, evitando que o relógio
+        # fique até 1s atrasado em relação à hora do sistema.
+        QTimer.singleShot(1000 - QTime.currentTime().msec(), self._start_periodic)
+
+        self._mostrar_hora()
 
+    def _start_periodic(self):
+        """Atualiza a hora no início do segundo e inicia o timer periódico."""
         self._mostrar_hora()
+        self._timer.start(1000)
 
     def _mostrar_hora(self):
         """
@@ -30,5 +46,8 @@ class RelogioWidget(QLCDNumber):
         criar o efeito de piscar dos 'dois pontos'.
         """
         time = QTime.currentTime()
-        text = time.toString('hh:mm:ss' if (time.second() % 2) == 0 else 'hh mm ss')
-        self.display(text)
\ No newline at end of file
+        text = time.toString(self._FMT_ODD if time.second() & 1 else self._FMT_EVEN)
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self.setText(text)
@@ -1,11 +1,16 @@
 # ui/setup_wizard_dialog.py
 from typing import Dict, Optional
+from urllib.parse import quote
 
 from PyQt6.QtWidgets import (QApplication, QComboBox, QDialog, QDialogButtonBox,
                              QFormLayout, QGroupBox, QLabel, QLineEdit,
                              QMessageBox, QRadioButton, QSpinBox,
                              QStackedWidget, QVBoxLayout, QWidget)
 
+# Driver do SQLAlchemy e porta padrão de cada tipo de banco de dados externo
+_DRIVER_MAP = {"postgresql": "psycopg2", "mysql": "pymysql"}
+_PORT_MAP = {"postgresql": 5432, "mysql": 3306}
+
 class SetupWizardDialog(QDialog):
     """
     Um diálogo de assistente de configuração para o banco de dados.
@@ -28,7 +33,7 @@ class SetupWizardDialog(QDialog):
         page1_layout = QVBoxLayout(page1)
         
         welcome_label = QLabel("<b>Bem-vindo ao Assistente de Configuração</b>")
-        welcome_label.setStyleSheet("font-size: 14pt;")
+        welcome_label.setObjectName("wizardTitle")  # Estilo em styles.DIALOG_LABEL_STYLE
         
         info_label = QLabel("É necessário configurar a conexão com o banco de dados para o primeiro uso.")
         info_label.setWordWrap(True)
@@ -101,8 +106,7 @@ class SetupWizardDialog(QDialog):
 
     def _update_default_port(self, db_type: str):
         """Atualiza a porta padrão com base no tipo de banco de dados selecionado."""
-        port_map = {"postgresql": 5432, "mysql": 3306}
-        self.db_port_input.setValue(port_map.get(db_type, 5432))
+        self.db_port_input.setValue(_PORT_MAP.get(db_type, 5432))
 
     def accept(self):
         """Valida os dados e prepara o dicionário de configuração antes de fechar."""
@@ -113,20 +117,27 @@ class SetupWizardDialog(QDialog):
 
         if self.external_db_radio.isChecked():
             db_type = self.db_type_input.currentText()
-            db_user = self.db_user_input.text().strip()
-            db_host = self.db_host_input.text().strip()
             db_port = self.db_port_input.text()
-            db_name = self.db_name_input.text().strip()
-            db_password = self.db_password_input.text()
-
-            if not all([db_user, db_host, db_name, db_password]):
-                QMessageBox.warning(self, "Campos Obrigatórios", "Todos os campos (usuário, host, nome do banco e senha) são obrigatórios.")
+            # Campos obrigatórios, lidos e validados em uma única passagem.
+            # A senha não passa por strip(): espaços podem fazer parte dela.
+            required = {
+                "usuário": self.db_user_input.text().strip(),
+                "host": self.db_host_input.text().strip(),
+                "nome do banco": self.db_name_input.text().strip(),
+                "senha": self.db_password_input.text(),
+            }
+            missing = [field for field, value in required.items() if not value]
+            if missing:
+                QMessageBox.warning(self, "Campos Obrigatórios", f"Preencha os campos obrigatórios: {', '.join(missing)}.")
                 return
+            db_user, db_host, db_name, db_password = required.values()
 
-            driver_map = {"postgresql": "psycopg2", "mysql": "pymysql"}
-            driver = driver_map.get(db_type)
+            driver = _DRIVER_MAP.get(db_type)
             driver_str = f"+{driver}" if driver else ""
-            db_url = f"{db_type}{driver_str}://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}"
+            # Usuário, senha e nome do banco são codificados para que caracteres como
+            # '@', ':' e '/' não quebrem a URL (o make_url do SQLAlchemy os decodifica).
+            db_url = (f"{db_type}{driver_str}://{quote(db_user, safe='')}:{quote(db_password, safe='')}"
+                      f"@{db_host}:{db_port}/{quote(db_name, safe='')}")
             
             self.config_data = {"DATABASE_URL": db_url}
             super().accept()
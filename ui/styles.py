@@ -1,40 +1,42 @@
 # ui/styles.py
+from functools import lru_cache
 
+@lru_cache(maxsize=64)
 def _darken_color(hex_color: str, percentage: int) -> str:
     """Escurece uma cor hexadecimal em uma determinada porcentagem."""
-    hex_color = hex_color.lstrip('#')
-    # Converte para RGB
-    rgb = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    # Converte para um único inteiro e separa os componentes RGB com deslocamentos de bits
+    value = int(hex_color.lstrip('#'), 16)
+    r, g, b = (value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF
     # Escurece cada componente
-    darker_rgb = tuple(max(0, int(c * (1 - percentage / 100.0))) for c in rgb)
+    factor = 1 - percentage / 100.0
+    r, g, b = max(0, int(r * factor)), max(0, int(g * factor)), max(0, int(b * factor))
     # Converte de volta para hexadecimal
-    return f"#{darker_rgb[0]:02x}{darker_rgb[1]:02x}{darker_rgb[2]:02x}"
+    return f"#{(r << 16) | (g << 8) | b:06x}"
 
-def get_button_style(button_type: str) -> str:
-    """
-    Retorna uma string de estilo QSS para um tipo de botão específico.
-    Tipos suportados: 'novo', 'editar', 'excluir', 'imprimir', 'pagar'.
-    """
-    # Mapeamento de tipos de botão para suas cores base e de texto
-    style_configs = {
-        "novo":     {"base": "#27ae60", "text": "white"},      # Verde
-        "editar":   {"base": "#2980b9", "text": "white"},      # Azul
-        "excluir":  {"base": "#c0392b", "text": "white"},      # Vermelho
-        "imprimir": {"base": "#7f8c8d", "text": "white"},      # Cinza (para imprimir e ver)
-        "pagar":    {"base": "#2ecc71", "text": "white"},      # Verde Claro
-    }
+# Mapeamento de tipos de botão para suas cores base e de texto
+_BUTTON_STYLE_CONFIGS = {
+    "novo":     {"base": "#27ae60", "text": "white"},      # Verde
+    "editar":   {"base": "#2980b9", "text": "white"},      # Azul
+    "excluir":  {"base": "#c0392b", "text": "white"},      # Vermelho
+    "imprimir": {"base": "#7f8c8d", "text": "white"},      # Cinza (para imprimir e ver)
+    "pagar":    {"base": "#2ecc71", "text": "white"},      # Verde Claro
+}
 
-    config = style_configs.get(button_type)
-    if not config:
-        return ""  # Retorna estilo vazio se o tipo não for encontrado
+def _render_button_style(button_type: str, config: dict) -> str:
+    """
+    Monta as regras QSS de um tipo de botão a partir da sua configuração de cores.
 
+    As regras valem para os botões com a propriedade dinâmica `buttonType`
+    igual ao tipo informado, ex: `button.setProperty("buttonType", "novo")`.
+    """
+    selector = f'QPushButton[buttonType="{button_type}"]'
     base_color = config["base"]
     text_color = config["text"]
     hover_color = _darken_color(base_color, 15)
     pressed_color = _darken_color(base_color, 30)
 
     return f"""
-        QPushButton {{
+        {selector} {{
             background-color: {base_color};
             color: {text_color};
             border: none;
@@ -44,18 +46,22 @@ def get_button_style(button_type: str) -> str:
             font-weight: bold;
             border-radius: 4px;
         }}
-        QPushButton:hover {{
+        {selector}:hover {{
             background-color: {hover_color};
         }}
-        QPushButton:pressed {{
+        {selector}:pressed {{
             background-color: {pressed_color};
         }}
-        QPushButton:disabled {{
+        {selector}:disabled {{
             background-color: #bdc3c7;
             color: #7f8c8d;
         }}
     """
 
+# Estilos dos botões de ação, montados uma única vez na importação do módulo.
+# Tipos suportados: 'novo', 'editar', 'excluir', 'imprimir', 'pagar'.
+BUTTON_STYLE = "".join(_render_button_style(key, config) for key, config in _BUTTON_STYLE_CONFIGS.items())
+
 # --- Estilos do Dashboard ---
 
 # Estilo para os cartões de indicadores
@@ -68,12 +74,16 @@ INDICATOR_CARD_STYLE = """
     }
 """
 
-INDICATOR_TITLE_STYLE = "font-size: 11pt; color: #636e72; font-weight: bold;"
-INDICATOR_VALUE_STYLE = "font-size: 18pt; color: #2d3436; font-weight: bold;"
+INDICATOR_TITLE_STYLE = """
+    QLabel#indicatorTitle { font-size: 11pt; color: #636e72; font-weight: bold; }
+"""
+INDICATOR_VALUE_STYLE = """
+    QLabel#indicatorValue { font-size: 18pt; color: #2d3436; font-weight: bold; }
+"""
 
 # Estilo para o relógio do dashboard
 RELOGIO_STYLE = """
-    QLCDNumber {
+    QLabel#relogio {
         background-color: #2b2b2b;
         color: #39FF14;
         border: 1px solid #444;
@@ -83,7 +93,7 @@ RELOGIO_STYLE = """
 
 # Estilo para os botões de atalho no dashboard
 SHORTCUT_BUTTON_STYLE = """
-    QPushButton {
+    QPushButton[buttonType="atalho"] {
         background-color: #f8f9fa;
         color: #343a40;
         border: 1px solid #dee2e6;
@@ -92,7 +102,31 @@ SHORTCUT_BUTTON_STYLE = """
         font-weight: bold;
         border-radius: 15px;
     }
-    QPushButton:hover {
+    QPushButton[buttonType="atalho"]:hover {
         background-color: #e9ecef;
     }
-"""
\ No newline at end of file
+"""
+
+# --- Estilos de rótulos dos diálogos e abas ---
+
+DIALOG_LABEL_STYLE = """
+    QLabel#wizardTitle { font-size: 14pt; }
+    QLabel#loginStatus { color: #555; }
+    QLabel#parcelaPreview { font-weight: bold; font-size: 11pt; color: #2980b9; }
+    QLabel#selectedCliente { font-style: italic; color: #555; padding: 5px 0; }
+"""
+
+# --- Folha de estilo da aplicação ---
+
+# Todos os estilos acima reunidos em uma única folha, aplicada uma vez no
+# QApplication (ver main.py). O Qt interpreta o QSS uma única vez, e os widgets
+# apenas definem o objectName ou a propriedade `buttonType` correspondente.
+APP_STYLESHEET = "".join((
+    BUTTON_STYLE,
+    INDICATOR_CARD_STYLE,
+    INDICATOR_TITLE_STYLE,
+    INDICATOR_VALUE_STYLE,
+    RELOGIO_STYLE,
+    SHORTCUT_BUTTON_STYLE,
+    DIALOG_LABEL_STYLE,
+))
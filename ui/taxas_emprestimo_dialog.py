@@ -1,42 +1,90 @@
-from PyQt6.QtWidgets import QDialog, QFormLayout, QDoubleSpinBox, QPushButton, QMessageBox
+from PyQt6 import sip
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QDialog, QFormLayout, QDoubleSpinBox, QLabel, QPushButton, QMessageBox
+from sqlalchemy.orm import Session
 from services.taxas_emprestimo_service import TaxaJurosService
 from decimal import Decimal
+from .workers import Worker
+
+
+def _spin_decimal(spin: QDoubleSpinBox) -> Decimal:
+    """
+    Converte o valor exibido no spinbox diretamente para Decimal, a partir do texto.
+
+    Evita a conversão float -> str -> Decimal; o texto já está arredondado para
+    as casas decimais do spinbox e sem o sufixo.
+    """
+    locale = spin.locale()
+    text = spin.cleanText().replace(locale.groupSeparator(), "").replace(locale.decimalPoint(), ".")
+    return Decimal(text)
 
 class TaxaJurosDialog(QDialog):
     def __init__(self, db_session, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Taxas de Juros")
+        self.db_session = db_session
         self.service = TaxaJurosService(db_session)
-        taxas = self.service.get_taxas()
         layout = QFormLayout(self)
 
+        self.status_label = QLabel("Carregando taxas...")
+        layout.addRow(self.status_label)
+
         self.simples = QDoubleSpinBox()
         self.simples.setSuffix("%")
         self.simples.setMaximum(100)
-        self.simples.setValue(float(taxas.taxa_juros_simples or 0.0))
         layout.addRow("Juros Simples:", self.simples)
 
         self.composto = QDoubleSpinBox()
         self.composto.setSuffix("%")
         self.composto.setMaximum(100)
-        self.composto.setValue(float(taxas.taxa_juros_composto or 0.0))
         layout.addRow("Juros Composto:", self.composto)
 
         self.mora = QDoubleSpinBox()
         self.mora.setSuffix("%")
         self.mora.setMaximum(100)
-        self.mora.setValue(float(taxas.taxa_juros_mora or 0.0))
         layout.addRow("Juros Mora:", self.mora)
 
-        btn_salvar = QPushButton("Salvar")
-        btn_salvar.clicked.connect(self.salvar)
-        layout.addRow(btn_salvar)
+        self.btn_salvar = QPushButton("Salvar")
+        self.btn_salvar.clicked.connect(self.salvar)
+        layout.addRow(self.btn_salvar)
+
+        # As taxas são lidas em segundo plano; até lá os campos e o botão ficam desabilitados.
+        self._set_campos_enabled(False)
+        worker = Worker(self._load_taxas)
+        worker.signals.finished.connect(self._on_taxas_loaded)
+        worker.signals.error.connect(self._on_taxas_error)
+        QThreadPool.globalInstance().start(worker)
+
+    def _load_taxas(self):
+        """Lê as taxas em uma sessão própria, pois a sessão da interface não pode ser usada em outra thread."""
+        session = Session(bind=self.db_session.get_bind())
+        try:
+            return TaxaJurosService(session).get_valores_taxas()
+        finally:
+            session.close()
+
+    def _on_taxas_loaded(self, taxas):
+        if sip.isdeleted(self):
+            return
+        for spin, valor in zip((self.simples, self.composto, self.mora), taxas):
+            spin.setValue(float(valor))
+        self.status_label.hide()
+        self._set_campos_enabled(True)
+
+    def _on_taxas_error(self, message: str):
+        if sip.isdeleted(self):
+            return
+        self.status_label.setText(f"Não foi possível carregar as taxas: {message}")
+
+    def _set_campos_enabled(self, enabled: bool):
+        for widget in (self.simples, self.composto, self.mora, self.btn_salvar):
+            widget.setEnabled(enabled)
 
     def salvar(self):
-        self.service.atualizar_taxas(
-            Decimal(str(self.simples.value())),
-            Decimal(str(self.composto.value())),
-            Decimal(str(self.mora.value()))
-        )
+        taxas = {
+            nome: _spin_decimal(spin)
+            for nome, spin in (("simples", self.simples), ("composto", self.composto), ("mora", self.mora))
+        }
+        self.service.atualizar_taxas(**taxas)
         QMessageBox.information(self, "Taxas Atualizadas", "Taxas salvas com sucesso!")
         self.accept()
@@ -7,18 +7,16 @@ from PyQt6.QtWidgets import (
 from typing import Optional, Dict, Any
 from models.usuario import Usuario, UserRole
 
+# Rótulos e papéis (roles) do ComboBox, montados uma única vez, e o índice de cada papel
+_ROLE_ITEMS = [(role.value.capitalize(), role) for role in UserRole]
+_ROLE_INDEX = {role: i for i, (_, role) in enumerate(_ROLE_ITEMS)}
+
 class UsuarioDialog(QDialog):
     """
     Janela de diálogo para criar ou editar um usuário.
     """
     def __init__(self, usuario: Optional[Usuario] = None, parent=None):
         super().__init__(parent)
-        self.usuario = usuario
-
-        if self.usuario:
-            self.setWindowTitle("Editar Usuário")
-        else:
-            self.setWindowTitle("Novo Usuário")
 
         self.layout = QVBoxLayout(self)
         self.form_layout = QFormLayout()
@@ -31,8 +29,8 @@ class UsuarioDialog(QDialog):
 
         self.role_input = QComboBox(self)
         # Adiciona os papéis (roles) do Enum ao ComboBox
-        for role in UserRole:
-            self.role_input.addItem(role.value.capitalize(), role)
+        for label, role in _ROLE_ITEMS:
+            self.role_input.addItem(label, role)
 
         # --- Adiciona campos ao layout do formulário ---
         self.form_layout.addRow("Nome:", self.nome_input)
@@ -49,18 +47,52 @@ class UsuarioDialog(QDialog):
 
         self.layout.addWidget(self.button_box)
 
+        # Dados capturados no aceite; a senha é apagada dos campos ao fechar (ver done)
+        self._accepted_data: Optional[Dict[str, Any]] = None
+
+        self.reset(usuario)
+
+    def reset(self, usuario: Optional[Usuario] = None):
+        """
+        Prepara o diálogo para criar um novo usuário ou editar o informado.
+
+        Permite reaproveitar a mesma instância do diálogo entre aberturas.
+        """
+        self.usuario = usuario
+        self._accepted_data = None
+        self.setWindowTitle("Editar Usuário" if usuario else "Novo Usuário")
+        self.senha_input.clear()
+
         # --- Preenche os campos se estiver editando ---
         if self.usuario:
             self.nome_input.setText(self.usuario.nome)
             self.email_input.setText(self.usuario.email)
             self.senha_input.setPlaceholderText("Deixe em branco para não alterar")
-            # Encontra e seleciona o papel (role) correto no ComboBox
-            index = self.role_input.findData(self.usuario.role)
-            if index >= 0:
+            # Seleciona o papel (role) correto no ComboBox
+            index = _ROLE_INDEX.get(self.usuario.role)
+            if index is not None:
                 self.role_input.setCurrentIndex(index)
+        else:
+            self.nome_input.clear()
+            self.email_input.clear()
+            self.senha_input.setPlaceholderText("")
+            self.role_input.setCurrentIndex(0)
+        self.nome_input.setFocus()
 
     def get_data(self) -> Dict[str, Any]:
-        """Retorna os dados dos campos do formulário em um dicionário."""
+        """
+        Retorna os dados do formulário em um dicionário.
+
+        Depois que o diálogo é aceito, os campos de senha já foram limpos; nesse
+        caso, retorna (uma única vez) os dados capturados no momento do aceite.
+        """
+        if self._accepted_data is not None:
+            data, self._accepted_data = self._accepted_data, None
+            return data
+        return self._read_fields()
+
+    def _read_fields(self) -> Dict[str, Any]:
+        """Lê os campos do formulário em um dicionário."""
         data = {
             "nome": self.nome_input.text().strip(),
             "email": self.email_input.text().strip(),
@@ -73,7 +105,7 @@ class UsuarioDialog(QDialog):
 
     def accept(self):
         """Valida os dados antes de fechar o diálogo."""
-        data = self.get_data()
+        data = self._read_fields()
         if not data["nome"] or not data["email"]:
             QMessageBox.warning(self, "Campos Obrigatórios", "Os campos Nome e Email são obrigatórios.")
             return
@@ -84,4 +116,10 @@ class UsuarioDialog(QDialog):
             return
 
         # Se a validação passar, aceita o diálogo
-        super().accept()
\ No newline at end of file
+        self._accepted_data = data
+        super().accept()
+
+    def done(self, result: int):
+        """Limpa a senha digitada sempre que o diálogo é fechado (aceito ou cancelado)."""
+        self.senha_input.clear()
+        super().done(result)
\ No newline at end of file
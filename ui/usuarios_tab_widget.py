@@ -6,19 +6,115 @@ Este widget encapsula toda a funcionalidade da aba de gerenciamento de usuários
 incluindo a interface do usuário (tabela, botões, campo de busca) e as operações
 de CRUD (Criar, Ler, Atualizar, Deletar).
 """
+import functools
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
-from PyQt6.QtWidgets import (QHeaderView, QHBoxLayout, QLabel, QMessageBox,
-                             QPushButton, QTableWidget, QTableWidgetItem,
+from PyQt6.QtCore import (QAbstractTableModel, QModelIndex, Qt, QThreadPool,
+                          QTimer, pyqtSignal)
+from PyQt6.QtWidgets import (QAbstractItemView, QHeaderView, QHBoxLayout, QLabel,
+                             QMessageBox, QPushButton, QTableView,
                              QLineEdit, QVBoxLayout, QWidget)
 
 from models.usuario import Usuario
 from services.usuario_service import UsuarioService
 from .usuario_dialog import UsuarioDialog
+from .deferred_refresh import DeferredRefreshMixin
+from .workers import Worker
 
 
-class UsuariosTabWidget(QWidget):
+class UsuarioTableModel(QAbstractTableModel):
+    """
+    Modelo de tabela somente leitura sobre a lista de usuários, paginado.
+
+    Mantém apenas as referências aos objetos `Usuario`; o texto de cada célula
+    é gerado sob demanda em `data()`, somente para as linhas que a view exibe.
+    Os usuários são buscados no banco em páginas de `PAGE_SIZE`: quando a view
+    pede mais linhas (`fetchMore`), o modelo emite `pageRequested` com o offset
+    da próxima página, e o dono do modelo a entrega via `append_page`.
+    """
+    PAGE_SIZE = 100
+
+    pageRequested = pyqtSignal(int)  # offset da próxima página
+
+    def __init__(self, cols, parent: Optional[QWidget] = None):
+        """
+        Args:
+            cols: A classe de constantes de colunas da tabela (índices e HEADERS).
+            parent (Optional[QWidget]): O objeto pai.
+        """
+        super().__init__(parent)
+        self._cols = cols
+        self._rows: List[Usuario] = []
+        self._has_more = False
+        self._fetching = False  # Uma página já foi pedida e ainda não chegou
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        self.pageRequested.emit(len(self._rows))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._cols.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._cols.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+        usuario = self._rows[index.row()]
+        column = index.column()
+        if column == self._cols.ID:
+            return str(usuario.id)
+        if column == self._cols.NOME:
+            return usuario.nome
+        if column == self._cols.EMAIL:
+            return usuario.email
+        if column == self._cols.CARGO:
+            return usuario.role.value
+        return None
+
+    def reset_pages(self):
+        """Remove todas as linhas e pede a primeira página."""
+        self.beginResetModel()
+        self._rows = []
+        self._has_more = True
+        self._fetching = False
+        self.endResetModel()
+        self.fetchMore()
+
+    def append_page(self, usuarios: List[Usuario]):
+        """Adiciona uma página recebida ao final do modelo."""
+        self._fetching = False
+        self._has_more = len(usuarios) >= self.PAGE_SIZE
+        if not usuarios:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(usuarios) - 1)
+        self._rows.extend(usuarios)
+        self.endInsertRows()
+
+    def page_failed(self):
+        """Interrompe a paginação após uma falha ao buscar uma página."""
+        self._fetching = False
+        self._has_more = False
+
+    def usuario_at(self, row: int) -> Usuario:
+        """Retorna o usuário exibido na linha informada."""
+        return self._rows[row]
+
+
+class UsuariosTabWidget(DeferredRefreshMixin, QWidget):
     """
     Um widget de aba para gerenciar usuários (CRUD e busca).
     """
@@ -41,19 +137,37 @@ class UsuariosTabWidget(QWidget):
         self.usuario_service = usuario_service
         self.usuario_logado = usuario_logado
         self.db_session = db_session
+        # Identificador da carga mais recente; páginas de cargas anteriores são descartadas
+        self._load_seq = 0
+        self._search_term = ""
+        # Diálogo de usuário criado no primeiro uso e reaproveitado (ver _get_dialog)
+        self._usuario_dialog: Optional[UsuarioDialog] = None
+        self._setup_search_timer()
         self._setup_ui()
-        self.load_usuarios()
+        # A consulta ao banco só acontece quando a aba é exibida pela primeira vez.
+        self.mark_dirty()
+
+    def _setup_search_timer(self):
+        """Configura o timer para debouncing da busca."""
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(250)  # Atraso de 250ms
+        self.search_timer.timeout.connect(self.search_usuarios)
 
     def _setup_ui(self):
         """Configura a interface da aba de usuários."""
         layout = QVBoxLayout(self)
 
+        # Caixa de mensagem única, reaproveitada por todos os avisos da aba (ver _msg)
+        self._msg_box = QMessageBox(self)
+
         # Layout de controle
         control_layout = QHBoxLayout()
         self.search_label = QLabel("Buscar por Nome ou Email:")
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Digite para buscar...")
-        self.search_input.textChanged.connect(self.search_usuarios)
+        # Cada tecla apenas reinicia o timer; a busca roda quando o usuário pausa a digitação.
+        self.search_input.textChanged.connect(self.search_timer.start)
         
         self.add_button = QPushButton("Novo Usuário")
         self.add_button.clicked.connect(self.add_usuario)
@@ -73,35 +187,104 @@ class UsuariosTabWidget(QWidget):
         layout.addLayout(control_layout)
 
         # Tabela de usuários
-        self.table = QTableWidget()
-        self.table.setColumnCount(len(self._UsuarioTableCols.HEADERS))
-        self.table.setHorizontalHeaderLabels(self._UsuarioTableCols.HEADERS)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        # A view só consulta o modelo para as linhas visíveis; nenhum item por célula é criado.
+        self.model = UsuarioTableModel(self._UsuarioTableCols, self)
+        self.model.pageRequested.connect(self._fetch_page)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        # Pede a próxima página quando a rolagem chega a uma página do fim
+        self.table.verticalScrollBar().valueChanged.connect(self._prefetch_if_near_end)
         layout.addWidget(self.table)
 
-    def load_usuarios(self, usuarios: Optional[List[Usuario]] = None):
-        """Carrega os dados dos usuários na tabela."""
-        try:
-            usuarios_a_carregar = usuarios if usuarios is not None else self.usuario_service.get_all_usuarios()
-            self.table.setRowCount(len(usuarios_a_carregar))
-            for row, usuario in enumerate(usuarios_a_carregar):
-                self.table.setItem(row, self._UsuarioTableCols.ID, QTableWidgetItem(str(usuario.id)))
-                self.table.setItem(row, self._UsuarioTableCols.NOME, QTableWidgetItem(usuario.nome))
-                self.table.setItem(row, self._UsuarioTableCols.EMAIL, QTableWidgetItem(usuario.email))
-                self.table.setItem(row, self._UsuarioTableCols.CARGO, QTableWidgetItem(usuario.role.value))
-        except Exception as e:
-            QMessageBox.critical(self, "Erro", f"Não foi possível carregar os usuários: {e}")
+    def _msg(self, icon: QMessageBox.Icon, title: str, text: str,
+             buttons: QMessageBox.StandardButton = QMessageBox.StandardButton.Ok) -> QMessageBox.StandardButton:
+        """
+        Exibe uma mensagem usando a caixa de mensagem reaproveitada da aba.
+
+        Returns:
+            QMessageBox.StandardButton: O botão clicado pelo usuário.
+        """
+        box = self._msg_box
+        temporary = box.isVisible()
+        if temporary:
+            # A caixa já está em uso (ex: um erro em segundo plano durante outro aviso)
+            box = QMessageBox(self)
+        box.setIcon(icon)
+        box.setWindowTitle(title)
+        box.setText(text)
+        box.setStandardButtons(buttons)
+        box.exec()
+        clicked = box.standardButton(box.clickedButton())
+        if temporary:
+            box.deleteLater()
+        return clicked
+
+    def load_usuarios(self):
+        """
+        Recarrega a tabela a partir da primeira página, aplicando o termo de busca atual.
+
+        As páginas seguintes são carregadas sob demanda, conforme a rolagem.
+        """
+        self._load_seq += 1  # Páginas de uma carga anterior passam a ser obsoletas
+        self._search_term = self.search_input.text()
+        self.model.reset_pages()
 
     def search_usuarios(self):
         """Filtra a lista de usuários com base no termo de busca."""
-        search_term = self.search_input.text()
-        self.load_usuarios(self.usuario_service.search_usuarios(search_term))
+        self.load_usuarios()
+
+    def _prefetch_if_near_end(self, value: int):
+        """Antecipa a busca da próxima página quando a rolagem se aproxima do fim."""
+        scroll_bar = self.table.verticalScrollBar()
+        if scroll_bar.maximum() - value <= scroll_bar.pageStep():
+            self.model.fetchMore()
+
+    def _fetch_page(self, offset: int):
+        """Busca uma página de usuários em segundo plano."""
+        worker = Worker(self._load_page_in_background, self._search_term, offset, self.model.PAGE_SIZE)
+        worker.signals.finished.connect(functools.partial(self._on_page_loaded, self._load_seq))
+        worker.signals.error.connect(functools.partial(self._on_page_error, self._load_seq))
+        QThreadPool.globalInstance().start(worker)
+
+    def _load_page_in_background(self, search_term: str, offset: int, limit: int) -> List[Usuario]:
+        """
+        Busca uma página de usuários fora da thread da interface.
+
+        A sessão da interface não pode ser compartilhada entre threads, então a
+        busca usa uma sessão própria e de curta duração, ligada ao mesmo banco.
+        Os atributos já carregados continuam acessíveis após o fechamento da sessão.
+        """
+        session = Session(bind=self.db_session.get_bind())
+        try:
+            return UsuarioService(session).search_usuarios(search_term, limit=limit, offset=offset)
+        finally:
+            session.close()
+
+    def _on_page_loaded(self, seq: int, usuarios: List[Usuario]):
+        """Slot chamado quando uma página chega; ignora páginas de cargas obsoletas."""
+        if seq != self._load_seq: return
+        self.model.append_page(usuarios)
+
+    def _on_page_error(self, seq: int, message: str):
+        """Slot chamado se a busca de uma página falhar."""
+        if seq != self._load_seq: return
+        self.model.page_failed()
+        self._msg(QMessageBox.Icon.Critical, "Erro", f"Não foi possível carregar os usuários: {message}")
+
+    def _get_dialog(self, usuario: Optional[Usuario] = None) -> UsuarioDialog:
+        """Retorna o diálogo de usuário, criado uma única vez e reiniciado a cada abertura."""
+        if self._usuario_dialog is None:
+            self._usuario_dialog = UsuarioDialog(usuario=usuario, parent=self)
+        else:
+            self._usuario_dialog.reset(usuario)
+        return self._usuario_dialog
 
     def add_usuario(self):
         """Abre o diálogo para adicionar um novo usuário."""
-        dialog = UsuarioDialog(parent=self)
+        dialog = self._get_dialog()
         if dialog.exec():
             data = dialog.get_data()
             try:
@@ -109,18 +292,18 @@ class UsuariosTabWidget(QWidget):
                 self.load_usuarios()
             except Exception as e:
                 self.db_session.rollback()
-                QMessageBox.critical(self, "Erro", f"Não foi possível criar o usuário: {e}")
+                self._msg(QMessageBox.Icon.Critical, "Erro", f"Não foi possível criar o usuário: {e}")
 
     def edit_usuario(self):
         """Abre o diálogo para editar o usuário selecionado."""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row < 0:
-            QMessageBox.warning(self, "Seleção Necessária", "Por favor, selecione um usuário para editar.")
+            self._msg(QMessageBox.Icon.Warning, "Seleção Necessária", "Por favor, selecione um usuário para editar.")
             return
-        usuario_id = int(self.table.item(selected_row, self._UsuarioTableCols.ID).text())
+        usuario_id = self.model.usuario_at(selected_row).id
         usuario = self.usuario_service.get_usuario_by_id(usuario_id)
         if usuario:
-            dialog = UsuarioDialog(usuario=usuario, parent=self)
+            dialog = self._get_dialog(usuario)
             if dialog.exec():
                 data = dialog.get_data()
                 if not data.get('senha'):  # Senha é opcional na edição
@@ -130,32 +313,34 @@ class UsuariosTabWidget(QWidget):
                     self.load_usuarios()
                 except Exception as e:
                     self.db_session.rollback()
-                    QMessageBox.critical(self, "Erro", f"Não foi possível atualizar o usuário: {e}")
+                    self._msg(QMessageBox.Icon.Critical, "Erro", f"Não foi possível atualizar o usuário: {e}")
 
     def delete_usuario(self):
         """Exclui o usuário selecionado."""
-        selected_row = self.table.currentRow()
+        selected_row = self.table.currentIndex().row()
         if selected_row < 0:
-            QMessageBox.warning(self, "Seleção Necessária", "Por favor, selecione um usuário para excluir.")
+            self._msg(QMessageBox.Icon.Warning, "Seleção Necessária", "Por favor, selecione um usuário para excluir.")
             return
-        usuario_id = int(self.table.item(selected_row, self._UsuarioTableCols.ID).text())
-        
+        usuario_selecionado = self.model.usuario_at(selected_row)
+        usuario_id = usuario_selecionado.id
+
         if usuario_id == self.usuario_logado.id:
-            QMessageBox.critical(self, "Ação Inválida", "Você não pode excluir o seu próprio usuário.")
+            self._msg(QMessageBox.Icon.Critical, "Ação Inválida", "Você não pode excluir o seu próprio usuário.")
             return
             
-        usuario_nome = self.table.item(selected_row, self._UsuarioTableCols.NOME).text()
-        reply = QMessageBox.question(self, "Confirmar Exclusão", f"Você tem certeza que deseja excluir o usuário '{usuario_nome}'?",
-                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        usuario_nome = usuario_selecionado.nome
+        reply = self._msg(QMessageBox.Icon.Question, "Confirmar Exclusão", f"Você tem certeza que deseja excluir o usuário '{usuario_nome}'?",
+                          QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 self.usuario_service.delete_usuario(usuario_id)
                 self.load_usuarios()
             except Exception as e:
                 self.db_session.rollback()
-                QMessageBox.critical(self, "Erro", f"Não foi possível excluir o usuário: {e}")
+                self._msg(QMessageBox.Icon.Critical, "Erro", f"Não foi possível excluir o usuário: {e}")
 
     def refresh_data(self):
         """Método público para recarregar os dados da aba, limpando a busca."""
         self.search_input.clear()
+        self.search_timer.stop()  # A lista completa é carregada logo abaixo
         self.load_usuarios()
\ No newline at end of file
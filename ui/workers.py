@@ -0,0 +1,54 @@
+# ui/workers.py
+"""
+Módulo de workers para execução de tarefas em segundo plano.
+
+Define um `Worker` genérico, baseado em QRunnable, que executa uma função no
+QThreadPool e entrega o resultado (ou o erro) à thread da interface por meio
+de sinais, sem bloquear a UI.
+"""
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """
+    Sinais emitidos por um `Worker`.
+
+    O PyQt não permite herdar de QObject e QRunnable ao mesmo tempo, por isso
+    os sinais ficam em um objeto separado, criado na thread da interface.
+    """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class Worker(QRunnable):
+    """
+    Executa `fn(*args, **kwargs)` em uma thread do QThreadPool.
+
+    Emite `signals.finished` com o valor de retorno em caso de sucesso, ou
+    `signals.error` com a mensagem da exceção em caso de falha.
+    """
+    def __init__(self, fn: Callable[..., Any], *args, **kwargs):
+        """
+        Inicializa o worker.
+
+        Args:
+            fn (Callable[..., Any]): A função a ser executada em segundo plano.
+            *args: Argumentos posicionais repassados para a função.
+            **kwargs: Argumentos nomeados repassados para a função.
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Executa a função e emite o sinal correspondente ao resultado."""
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
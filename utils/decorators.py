@@ -4,22 +4,33 @@ import functools
 import logging
 from sqlalchemy.orm import Session
 
-def db_session_manager(func):
+def db_session_manager(func=None, *, readonly: bool = False):
     """
     Um decorator para gerenciar sessões de banco de dados para métodos de serviço.
     Ele lida com commit, rollback e log de erros genérico.
     Assume que o primeiro argumento da função decorada é 'self'
     e que 'self' possui um atributo 'db_session'.
+
+    Pode ser usado diretamente (`@db_session_manager`) ou com argumentos
+    (`@db_session_manager(readonly=True)`). Métodos somente leitura não fazem
+    commit ao final, evitando um round-trip ao banco; em caso de erro, a
+    transação ainda é revertida.
     """
-    @functools.wraps(func)
-    def wrapper(self, *args, **kwargs):
-        session: Session = self.db_session
-        try:
-            result = func(self, *args, **kwargs)
-            session.commit()
-            return result
-        except Exception as e:
-            session.rollback()
-            logging.error(f"Falha na transação do banco de dados em {func.__name__}. Revertendo. Erro: {e}")
-            raise
-    return wrapper
\ No newline at end of file
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            session: Session = self.db_session
+            try:
+                result = func(self, *args, **kwargs)
+                if not readonly:
+                    session.commit()
+                return result
+            except Exception as e:
+                session.rollback()
+                logging.error(f"Falha na transação do banco de dados em {func.__name__}. Revertendo. Erro: {e}")
+                raise
+        return wrapper
+
+    if func is not None:
+        return decorator(func)
+    return decorator
@@ -1,7 +1,25 @@
 # utils/helpers.py
 
 import bcrypt
+import hashlib
+import hmac
 import logging
+import os
+import threading
+from collections import OrderedDict
+
+# Funções do bcrypt vinculadas uma única vez e custo (rounds) do hash centralizado
+_GENSALT = bcrypt.gensalt
+_HASHPW = bcrypt.hashpw
+_BCRYPT_ROUNDS = 12
+
+# Cache das verificações de senha bem-sucedidas (ver verify_password).
+# A chave é um HMAC da senha com uma chave aleatória gerada a cada execução,
+# de modo que a senha em texto puro nunca fica armazenada em memória.
+_VERIFY_CACHE_MAXSIZE = 256
+_verify_cache_key = os.urandom(32)
+_verify_cache: "OrderedDict[tuple, bool]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
 
 def hash_password(password: str) -> bytes:
     """
@@ -9,20 +27,38 @@ def hash_password(password: str) -> bytes:
     Retorna o hash como bytes, que é o formato ideal para armazenar.
     """
     try:
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
-        return hashed_password
+        return _HASHPW(password.encode('utf-8'), _GENSALT(_BCRYPT_ROUNDS))
     except Exception as e:
         logging.error(f"Erro ao gerar hash da senha: {e}")
         raise
 
 def verify_password(plain_password: str, hashed_password: bytes) -> bool:
-    """Verifica se uma senha corresponde ao seu hash."""
+    """
+    Verifica se uma senha corresponde ao seu hash.
+
+    Verificações bem-sucedidas ficam em um pequeno cache LRU, evitando repetir
+    o custo do bcrypt para as mesmas credenciais. Falhas nunca são guardadas:
+    cada tentativa com senha errada continua pagando o custo completo do bcrypt.
+    """
     try:
         if not plain_password or not hashed_password:
             return False
+        plain_bytes = plain_password.encode('utf-8')
+        cache_key = (hmac.new(_verify_cache_key, plain_bytes, hashlib.sha256).digest(), hashed_password)
+        with _verify_cache_lock:
+            if cache_key in _verify_cache:
+                _verify_cache.move_to_end(cache_key)
+                return True
+
         # O hash do banco já vem como bytes, não precisa de .encode()
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password)
+        if not bcrypt.checkpw(plain_bytes, hashed_password):
+            return False
+
+        with _verify_cache_lock:
+            _verify_cache[cache_key] = True
+            if len(_verify_cache) > _VERIFY_CACHE_MAXSIZE:
+                _verify_cache.popitem(last=False)
+        return True
     except (ValueError, TypeError) as e:
         logging.warning(f"Erro ao verificar a senha (hash inválido ou corrompido): {e}")
         return False